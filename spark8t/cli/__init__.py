@@ -1,5 +1,3 @@
-import os
-
 from spark8t.domain import Defaults
 
-defaults = Defaults(dict(os.environ))
+defaults = Defaults()
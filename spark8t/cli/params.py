@@ -1,4 +1,5 @@
 import logging
+import re
 from argparse import ArgumentParser, Namespace
 from typing import Callable, List, Optional
 
@@ -6,6 +7,11 @@ from spark8t.cli import defaults
 from spark8t.services import AbstractKubeInterface, KubeInterface, LightKube
 from spark8t.utils import DEFAULT_LOGGING_FILE, config_from_file, environ
 
+K8S_MASTER_PREFIX = re.compile("^k8s://")
+
+# CLI commands are short-lived, so the resources they read are cached for a couple of seconds
+CLI_CACHE_TTL = 2.0
+
 
 def parse_arguments_with(
     parsers: List[Callable[[ArgumentParser], ArgumentParser]],
@@ -87,6 +93,16 @@ def k8s_parser(parser: ArgumentParser) -> ArgumentParser:
         type=str,
         help="Kind of backend to be used for talking to K8s",
     )
+    parser.add_argument(
+        "--read-backend",
+        default="kubectl",
+        choices=KubeInterface.READ_BACKENDS,
+        type=str,
+        help="Backend used by the kubectl backend for single-resource reads. 'kubectl' runs one "
+        "kubectl process per read, 'proxy' goes through a long-lived kubectl proxy, 'lightkube' "
+        "and 'auto' read in-process from the kube config, which must point to the same cluster "
+        "as the kubectl command.",
+    )
     return parser
 
 
@@ -128,10 +144,20 @@ def add_deploy_arguments(parser: ArgumentParser) -> ArgumentParser:
 
 
 def get_kube_interface(args: Namespace) -> AbstractKubeInterface:
-    _class = LightKube if args.backend == "lightkube" else KubeInterface
-
-    return _class(
-        args.kubeconfig or defaults.kube_config, defaults, context_name=args.context
+    if args.backend == "lightkube":
+        return LightKube(
+            args.kubeconfig or defaults.kube_config,
+            defaults,
+            context_name=args.context,
+            cache_ttl=CLI_CACHE_TTL,
+        )
+
+    return KubeInterface(
+        args.kubeconfig or defaults.kube_config,
+        defaults,
+        context_name=args.context,
+        cache_ttl=CLI_CACHE_TTL,
+        read_backend=args.read_backend,
     )
 
 
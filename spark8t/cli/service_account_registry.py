@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 
 from argparse import ArgumentParser, Namespace
+from dataclasses import replace
 from enum import Enum
 from logging import Logger
+from typing import Optional, Sequence
 
 from spark8t.cli.params import (
     add_config_arguments,
@@ -111,12 +113,15 @@ def main(args: Namespace, logger: Logger):
     )
 
     if args.action == Actions.CREATE:
-        service_account = build_service_account_from_args(args, registry)
-        service_account.extra_confs = (
-            PropertyFile.read(args.properties_file)
-            if args.properties_file is not None
-            else PropertyFile.empty()
-        ) + parse_conf_overrides(args.conf)
+        service_account = replace(
+            build_service_account_from_args(args, registry),
+            extra_confs=(
+                PropertyFile.read(args.properties_file)
+                if args.properties_file is not None
+                else PropertyFile.empty()
+            )
+            + parse_conf_overrides(args.conf),
+        )
 
         registry.create(service_account)
 
@@ -189,10 +194,19 @@ def main(args: Namespace, logger: Logger):
             print(print_line)
 
 
-if __name__ == "__main__":
+def run(argv: Optional[Sequence[str]] = None) -> int:
+    """Parse the given command line arguments and run the CLI in-process.
+
+    Args:
+        argv: command line arguments, excluding the program name. Defaults to
+              sys.argv[1:] when not provided.
+
+    Returns:
+        The exit code of the command.
+    """
     args = create_service_account_registry_parser(
         ArgumentParser(description="Spark Client Setup")
-    ).parse_args()
+    ).parse_args(argv)
 
     logger = setup_logging(
         args.log_level, args.log_conf_file, "spark8t.cli.service_account_registry"
@@ -200,9 +214,11 @@ if __name__ == "__main__":
 
     try:
         main(args, logger)
-        exit(0)
+        return 0
     except (AccountNotFound, PrimaryAccountNotFound, ResourceAlreadyExists) as e:
         print(str(e))
-        exit(1)
-    except Exception as e:
-        raise e
+        return 1
+
+
+if __name__ == "__main__":
+    exit(run())
@@ -1,11 +1,11 @@
 #!/usr/bin/env python3
 
-import re
 from argparse import Namespace
 from logging import Logger
 from typing import Optional
 
 from spark8t.cli.params import (
+    K8S_MASTER_PREFIX,
     add_config_arguments,
     add_deploy_arguments,
     add_logging_arguments,
@@ -25,7 +25,7 @@ def main(args: Namespace, logger: Logger):
     kube_interface = get_kube_interface(args)
 
     registry = K8sServiceAccountRegistry(
-        kube_interface.select_by_master(re.compile("^k8s://").sub("", args.master))
+        kube_interface.select_by_master(K8S_MASTER_PREFIX.sub("", args.master))
         if args.master is not None
         else kube_interface
     )
@@ -1,12 +1,15 @@
 import io
 import os
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from functools import cached_property
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 
 from spark8t.utils import WithLogging, union
 
+_PROPERTY_SEPARATOR = re.compile("=| ")
+
 
 class PropertyFile(WithLogging):
     """Class for providing basic functionalities for IO properties files."""
@@ -54,12 +57,26 @@ class PropertyFile(WithLogging):
 
     @staticmethod
     def parse_property_line(line: str) -> Tuple[str, str]:
-        prop_assignment = list(filter(None, re.split("=| ", line.strip())))
+        prop_assignment = list(filter(None, _PROPERTY_SEPARATOR.split(line.strip())))
         prop_key = prop_assignment[0].strip()
         option_assignment = line.split("=", 1)
         value = option_assignment[1].strip()
         return prop_key, value
 
+    @classmethod
+    def try_parse_line(cls, line: str) -> Optional[Tuple[str, str]]:
+        """Parse a line of the configuration into a key-value pair.
+
+        Args:
+            line: a line of the configuration
+
+        Returns:
+            the key-value pair, or None if the line is empty, commented or not an assignment
+        """
+        if "=" not in line or not cls.is_line_parsable(line):
+            return None
+        return cls.parse_property_line(line)
+
     @classmethod
     def _read_property_file_unsafe(cls, name: str) -> Dict:
         """Read properties in given file into a dictionary.
@@ -190,17 +207,42 @@ class PropertyFile(WithLogging):
         )
 
 
+class LazyPropertyFile(PropertyFile):
+    """PropertyFile whose properties are only loaded when first accessed."""
+
+    def __init__(self, loader: Callable[[], Dict[str, Any]]):
+        """Initialize a LazyPropertyFile class with a function providing the properties.
+
+        Args:
+            loader: function returning the properties dictionary, called at most once on first access
+        """
+        self._loader: Optional[Callable[[], Dict[str, Any]]] = loader
+        self._props: Optional[Dict[str, Any]] = None
+
+    @property
+    def props(self) -> Dict[str, Any]:
+        loader = self._loader
+        if loader is not None:
+            self._props = loader()
+            self._loader = None
+        return self._props
+
+    @props.setter
+    def props(self, props: Dict[str, Any]):
+        self._props, self._loader = props, None
+
+
 class Defaults:
     """Class containing all relevant defaults for the application."""
 
-    def __init__(self, environ: Dict = dict(os.environ)):
+    def __init__(self, environ: Optional[Mapping[str, str]] = None):
         """Initialize a Defaults class using the value contained in a dictionary
 
         Args:
-            environ: dictionary representing the environment. Default uses the os.environ key-value pairs.
+            environ: mapping representing the environment. Default uses os.environ.
         """
 
-        self.environ = environ if environ is not None else {}
+        self.environ = environ if environ is not None else os.environ
 
     @property
     def spark_home(self):
@@ -293,31 +335,35 @@ class Defaults:
 
 @dataclass
 class ServiceAccount:
-    """Class representing the spark ServiceAccount domain object."""
+    """Class representing the spark ServiceAccount domain object.
+
+    The id and configurations are derived from name, namespace and extra_confs and cached,
+    hence these fields must not be reassigned once the object is created. Use
+    dataclasses.replace to obtain a service account with different values.
+    """
 
     name: str
     namespace: str
     api_server: str
     primary: bool = False
-    extra_confs: PropertyFile = PropertyFile.empty()
+    extra_confs: PropertyFile = field(default_factory=PropertyFile.empty)
 
-    @property
-    def id(self):
-        """Return the service account id, as a concatenation of namespace and username."""
-        return f"{self.namespace}:{self.name}"
-
-    @property
-    def _k8s_configurations(self):
-        return PropertyFile(
+    def __post_init__(self):
+        # service account id, as a concatenation of namespace and username
+        self.id = f"{self.namespace}:{self.name}"
+        self._k8s_configurations = PropertyFile(
             {
                 "spark.kubernetes.authenticate.driver.serviceAccountName": self.name,
                 "spark.kubernetes.namespace": self.namespace,
             }
         )
 
-    @property
+    @cached_property
     def configurations(self) -> PropertyFile:
         """Return the service account configuration, associated to a given spark service account."""
+        # computed on first access, as extra_confs may be lazily loaded from K8s
+        if not self.extra_confs:
+            return self._k8s_configurations
         return self.extra_confs + self._k8s_configurations
 
 
@@ -1,16 +1,42 @@
 # mypy: ignore-errors
 
+import atexit
 import base64
-import io
+import json
+import logging
 import os
+import re
+import shlex
 import socket
 import subprocess
+import threading
+import time
 from abc import ABC, ABCMeta, abstractmethod
+from binascii import a2b_base64
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import replace
 from enum import Enum
-from functools import cached_property
+from functools import cached_property, lru_cache, partial, wraps
+from pathlib import Path
+from tempfile import TemporaryFile
 from types import MappingProxyType
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
+import httpx
 import yaml
 from lightkube import Client, KubeConfig, SingleConfig, codecs
 from lightkube.core.exceptions import ApiError
@@ -24,6 +50,7 @@ from lightkube.types import PatchType
 from spark8t.domain import (
     Defaults,
     KubernetesResourceType,
+    LazyPropertyFile,
     PropertyFile,
     ServiceAccount,
 )
@@ -37,33 +64,306 @@ from spark8t.literals import MANAGED_BY_LABELNAME, PRIMARY_LABELNAME, SPARK8S_LA
 from spark8t.utils import (
     PercentEncodingSerializer,
     WithLogging,
+    YamlSafeLoader,
     environ,
     execute_command_output,
     filter_none,
     listify,
+    parse_json_shell_output,
     parse_yaml_shell_output,
+    run_concurrently,
+    stream_json_shell_items,
     umask_named_temporary_file,
 )
 
+# label selectors, either as "key=value" entries or as a key -> value mapping where
+# None selects the resources having the key, whatever its value
+LabelSelector = Union[List[str], Mapping[str, Optional[str]]]
+
+# lightkube resource classes, indexed by resource type
+_OBJ_MAPPING: Mapping[KubernetesResourceType, Type[GlobalResource]] = MappingProxyType(
+    {
+        KubernetesResourceType.ROLE: Role,
+        KubernetesResourceType.SERVICEACCOUNT: LightKubeServiceAccount,
+        KubernetesResourceType.SECRET: Secret,
+        KubernetesResourceType.ROLEBINDING: RoleBinding,
+        KubernetesResourceType.SECRET_GENERIC: Secret,
+        KubernetesResourceType.NAMESPACE: Namespace,
+    }
+)
+
+# name of the Defaults property holding the template of each resource type
+_TEMPLATES: Mapping[KubernetesResourceType, str] = MappingProxyType(
+    {
+        KubernetesResourceType.SERVICEACCOUNT: "template_serviceaccount",
+        KubernetesResourceType.ROLE: "template_role",
+        KubernetesResourceType.ROLEBINDING: "template_rolebinding",
+    }
+)
+
+DEFAULT_CACHE_TTL = 0.0
+DEFAULT_CACHE_MAXSIZE = 256
+
+_CacheKey = Tuple[str, str, str, Optional[str]]
+
+
+class _ResourceCache:
+    """Bounded cache of retrieved K8s resources, whose entries expire after a time-to-live.
+
+    Entries are kept in insertion order. On insert, expired entries at the front are dropped,
+    then the oldest entries are evicted while the cache exceeds its maximum size. The cache can
+    be shared across threads and interfaces.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_MAXSIZE):
+        """Initialise an empty cache.
+
+        Args:
+            maxsize: maximum number of entries kept in the cache
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[_CacheKey, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: _CacheKey, now: float) -> Optional[Tuple[float, Any]]:
+        """Return the (expiry, value) entry of a key, or None if missing or expired.
+
+        Args:
+            key: key of the entry
+            now: current monotonic time
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= now:
+                del self._entries[key]
+                return None
+            return entry
+
+    def set(self, key: _CacheKey, value: Any, expiry: float, now: float):
+        """Store a value until the given expiry time, evicting expired and oldest entries.
+
+        Args:
+            key: key of the entry
+            value: value to be cached
+            expiry: monotonic time after which the entry expires
+            now: current monotonic time
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (expiry, value)
+            while self._entries and next(iter(self._entries.values()))[0] <= now:
+                self._entries.popitem(last=False)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, resource_type: str, resource_name: str):
+        """Drop the entries of a given resource, in any context and namespace.
+
+        Args:
+            resource_type: type of the resource, e.g. service account, secret, etc.
+            resource_name: name of the resource
+        """
+        with self._lock:
+            for key in [
+                key
+                for key in self._entries
+                if key[1] == resource_type and key[2] == resource_name
+            ]:
+                del self._entries[key]
+
+
+def cached_resource(resource_type: KubernetesResourceType) -> Callable:
+    """Return a decorator memoizing the retrieval of a K8s resource for `cache_ttl` seconds.
+
+    Entries are keyed by context, resource type, name and namespace, and they are dropped by
+    the interface whenever the resource is modified through it. Callers get their own copy of
+    the cached value, so modifying it does not affect later reads.
+
+    Args:
+        resource_type: type of the resource returned by the decorated method
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, resource_name: str, namespace: Optional[str] = None):
+            args = (resource_name,) if namespace is None else (resource_name, namespace)
+
+            if self.cache_ttl <= 0:
+                return func(self, *args)
+
+            key = (self.context_name, resource_type, resource_name, namespace)
+            now = time.monotonic()
+
+            cached = self._cache.get(key, now)
+            if cached is not None:
+                return deepcopy(cached[1])
+
+            value = func(self, *args)
+            self._cache.set(key, deepcopy(value), now + self.cache_ttl, now)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+@lru_cache(maxsize=8)
+def _load_kube_config(filename: Path, mtime: int) -> KubeConfig:
+    """Parse a kube config file.
+
+    Results are memoized and shared by all the interfaces reading the same file, the
+    modification time being part of the key so that edits to the file are picked up.
+
+    Args:
+        filename: absolute path of the kube config file
+        mtime: modification time of the file, in nanoseconds
+    """
+    with filename.open("rb") as fid:
+        return KubeConfig.from_dict(
+            yaml.load(fid, Loader=YamlSafeLoader), fname=filename
+        )
+
+
+@lru_cache(maxsize=None)
+def _load_template(filename: str) -> str:
+    """Return the content of a resource template, read once per process.
+
+    Args:
+        filename: path of the template file
+    """
+    return Path(filename).read_text()
+
+
+def _render_template(
+    defaults: Defaults,
+    resource_type: KubernetesResourceType,
+    resource_name: str,
+    namespace: Optional[str] = None,
+    **values: Any,
+) -> GlobalResource:
+    """Return the lightkube object of a resource, rendered from its template.
+
+    Args:
+        defaults: defaults providing the path of the templates
+        resource_type: type of the resource, e.g. service account, role or rolebinding
+        resource_name: name of the resource
+        namespace: namespace of the resource
+        values: other values of the template variables
+    """
+    return codecs.load_all_yaml(
+        _load_template(getattr(defaults, _TEMPLATES[resource_type])),
+        context=filter_none(
+            {"resourcename": resource_name, "namespace": namespace, **values}
+        ),
+    )[0]
+
+
+def _decode_secret(secret: Dict[str, Any]) -> Dict[str, Any]:
+    """Decode in place the base64-encoded data of a secret, represented as dictionary.
+
+    Args:
+        secret: secret as returned by the Kubernetes API
+    """
+    secret["data"] = {
+        k: a2b_base64(v).decode("utf-8") for k, v in (secret.get("data") or {}).items()
+    }
+    return secret
+
+
+@lru_cache(maxsize=16)
+def _lightkube_client(kube_config: KubeConfig, context_name: str) -> Client:
+    """Return a lightkube client for a context of a parsed kube config.
+
+    Clients are shared by all the interfaces using the same parsed kube config and context, so that
+    their pooled HTTP connections are reused, e.g. across with_context calls. A kube config
+    reloaded from disk is a new object, hence it gets new clients.
+
+    Args:
+        kube_config: parsed kube config
+        context_name: name of the context to connect to
+    """
+    return Client(config=kube_config.get(context_name))
+
+
+def _kube_config_mtimes(kube_config: Optional[str]) -> Tuple[Optional[int], ...]:
+    """Return the modification times of the kube config files kubectl reads by default.
+
+    Args:
+        kube_config: value of the KUBECONFIG variable, i.e. a list of paths separated by os.pathsep
+    """
+    paths = (kube_config or os.path.join("~", ".kube", "config")).split(os.pathsep)
+
+    def mtime(path: str) -> Optional[int]:
+        try:
+            return Path(path).expanduser().stat().st_mtime_ns
+        except OSError:
+            return None
+
+    return tuple(mtime(path) for path in paths if path)
+
+
+@lru_cache(maxsize=8)
+def _autodetect_config(
+    context_name: Optional[str],
+    kubectl_cmd: str,
+    kube_config_mtimes: Tuple[Optional[int], ...],
+) -> Dict[str, Any]:
+    """Return the minified kube config exported by kubectl.
+
+    Results are memoized, the kube config modification times being part of the key so that
+    edits to the files are picked up.
+
+    Args:
+        context_name: context to be used to export the cluster configuration
+        kubectl_cmd: kubectl command
+        kube_config_mtimes: modification times of the kube config files
+    """
+    cmd = shlex.split(kubectl_cmd)
+
+    if context_name:
+        cmd += ["--context", context_name]
+
+    return parse_json_shell_output(
+        cmd + ["config", "view", "--raw", "--minify", "-o", "json"]
+    )
+
 
 class AbstractKubeInterface(WithLogging, metaclass=ABCMeta):
     """Abstract class for implementing Kubernetes Interface."""
 
+    _cache_aliases = MappingProxyType(
+        {KubernetesResourceType.SECRET_GENERIC: KubernetesResourceType.SECRET}
+    )
+
     def __init__(
         self,
         kube_config_file: Union[None, str, Dict[str, Any]],
         defaults: Defaults,
         context_name: Optional[str] = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
     ):
         """Initialise a KubeInterface class from a kube config file.
 
         Args:
             kube_config_file: kube config path
             context_name: name of the context to be used
+            cache_ttl: number of seconds retrieved service accounts and secrets are cached for.
+                       Non-positive values, the default, disable caching. Changes made outside
+                       of this interface are not seen until the cached entries expire.
         """
         self.kube_config_file = kube_config_file
         self.defaults = defaults
         self._context_name = context_name
+        self.cache_ttl = cache_ttl
+        self._cache = _ResourceCache()
+        self._kube_config_cache: Optional[Tuple[Optional[int], KubeConfig]] = None
+        self._single_config_cache: Optional[Tuple[KubeConfig, str, SingleConfig]] = None
+        self._contexts_by_server_cache: Optional[
+            Tuple[KubeConfig, Mapping[str, Tuple[str, ...]]]
+        ] = None
 
     def with_context(self, context_name: str) -> "AbstractKubeInterface":
         """Return a new KubeInterface object using a different context.
@@ -71,42 +371,162 @@ class AbstractKubeInterface(WithLogging, metaclass=ABCMeta):
         Args:
             context_name: context to be used
         """
-        return type(self)(self.kube_config_file, self.defaults, context_name)
+        return self._share_state(
+            type(self)(
+                self.kube_config_file,
+                self.defaults,
+                context_name,
+                cache_ttl=self.cache_ttl,
+            )
+        )
 
-    @cached_property
+    def _share_state(self, other: "AbstractKubeInterface") -> "AbstractKubeInterface":
+        """Share the parsed kube config and the resource cache with an interface derived from this one.
+
+        Cache entries are keyed by context, hence they can be shared by interfaces on different contexts.
+
+        Args:
+            other: interface on the same kube config, e.g. using a different context
+        """
+        other._kube_config_cache = self._kube_config_cache
+        other._contexts_by_server_cache = self._contexts_by_server_cache
+        other._cache = self._cache
+        return other
+
+    def _invalidate_cache(self, resource_type: str, resource_name: str):
+        """Drop the cached entries of a given resource, in any namespace.
+
+        Args:
+            resource_type: type of the resource, e.g. service account, secret, etc.
+            resource_name: name of the resource
+        """
+        self._cache.discard(
+            self._cache_aliases.get(resource_type, resource_type), resource_name
+        )
+
+    def _namespaced_resources(
+        self, resources: List[Tuple[KubernetesResourceType, str]]
+    ) -> List[Tuple[KubernetesResourceType, str]]:
+        """Return the resources with their canonical type, e.g. secret for "secret generic".
+
+        Args:
+            resources: type and name of namespaced resources
+
+        Raises:
+            ValueError: when a resource is not namespaced
+        """
+        if any(
+            resource_type == KubernetesResourceType.NAMESPACE
+            for resource_type, _ in resources
+        ):
+            raise ValueError(
+                "Namespaces cannot be deleted together with namespaced resources."
+            )
+        return [
+            (
+                self._cache_aliases.get(resource_type, resource_type),
+                resource_name,
+            )
+            for resource_type, resource_name in resources
+        ]
+
+    def _load_config(self, force: bool = False) -> KubeConfig:
+        """Return the parsed kube config, re-reading the file only when it changed on disk.
+
+        Args:
+            force: re-parse the kube config regardless of the cached value
+        """
+        if isinstance(self.kube_config_file, str):
+            filename = Path(self.kube_config_file).expanduser().absolute()
+            mtime = filename.stat().st_mtime_ns
+            if (
+                force
+                or self._kube_config_cache is None
+                or self._kube_config_cache[0] != mtime
+            ):
+                load = _load_kube_config.__wrapped__ if force else _load_kube_config
+                self._kube_config_cache = (mtime, load(filename, mtime))
+            return self._kube_config_cache[1]
+
+        if force or self._kube_config_cache is None:
+            if not self.kube_config_file:
+                config = KubeConfig.from_env()
+            elif isinstance(self.kube_config_file, dict):
+                config = KubeConfig.from_dict(self.kube_config_file)
+            else:
+                raise ValueError(
+                    f"malformed kube_config: type {type(self.kube_config_file)}"
+                )
+            self._kube_config_cache = (None, config)
+
+        return self._kube_config_cache[1]
+
+    @property
     def kube_config(self) -> KubeConfig:
         """Return the kube config file parsed as a dictionary"""
-        if not self.kube_config_file:
-            return KubeConfig.from_env()
+        return self._load_config()
 
-        if isinstance(self.kube_config_file, str):
-            return KubeConfig.from_file(self.kube_config_file)
-        elif isinstance(self.kube_config_file, dict):
-            return KubeConfig.from_dict(self.kube_config_file)
-        else:
-            raise ValueError(
-                f"malformed kube_config: type {type(self.kube_config_file)}"
+    def _resolve_context(self) -> Tuple[KubeConfig, str, SingleConfig]:
+        """Return the kube config along with the name and configuration of the context in use.
+
+        The context is resolved once per parsed kube config, and again only when the file is reloaded.
+        """
+        config = self.kube_config
+        if (
+            self._single_config_cache is None
+            or self._single_config_cache[0] is not config
+        ):
+            context_name = self._context_name or config.current_context
+            self._single_config_cache = (
+                config,
+                context_name,
+                config.get(context_name),
             )
+        return self._single_config_cache
 
-    @cached_property
+    @property
     def context_name(self) -> str:
-        return self._context_name or self.kube_config.current_context
+        return self._context_name or self._resolve_context()[1]
 
-    @cached_property
+    @property
     def single_config(self) -> SingleConfig:
-        return self.kube_config.get(self.context_name)
+        return self._resolve_context()[2]
 
-    @cached_property
+    @property
+    def _contexts_by_server(self) -> Mapping[str, Tuple[str, ...]]:
+        """Return the names of the contexts in the kube config, indexed by cluster api-server.
+
+        The index is read-only, so that it can be shared across interfaces and threads.
+        """
+        config = self.kube_config
+        if (
+            self._contexts_by_server_cache is None
+            or self._contexts_by_server_cache[0] is not config
+        ):
+            index: Dict[str, List[str]] = {}
+            for name, context in config.contexts.items():
+                index.setdefault(config.clusters[context.cluster].server, []).append(
+                    name
+                )
+            self._contexts_by_server_cache = (
+                config,
+                MappingProxyType(
+                    {server: tuple(names) for server, names in index.items()}
+                ),
+            )
+        return self._contexts_by_server_cache[1]
+
+    @property
     def api_server(self):
         """Return current K8s api-server endpoint."""
         return self.single_config.cluster.server
 
-    @cached_property
+    @property
     def namespace(self):
         """Return current namespace."""
         return self.single_config.context.namespace
 
-    @cached_property
+    @property
     def user(self):
         """Return current admin user."""
         return self.single_config.context.user
@@ -119,22 +539,25 @@ class AbstractKubeInterface(WithLogging, metaclass=ABCMeta):
 
     @abstractmethod
     def get_service_accounts(
-        self, namespace: Optional[str] = None, labels: Optional[List[str]] = None
+        self,
+        namespace: Optional[str] = None,
+        labels: Optional[LabelSelector] = None,
     ) -> List[Dict[str, Any]]:
         """Return a list of service accounts, represented as dictionary.
 
         Args:
             namespace: namespace where to list the service accounts. Default is to None, which will return all service
                        account in all namespaces
-            labels: filter to be applied to retrieve service account which match certain labels.
+            labels: filter to be applied to retrieve service account which match certain labels, either as a
+                    list of "key=value" entries or as a mapping where a None value only requires the key.
         """
         pass
 
     @abstractmethod
     def get_secret(
         self, secret_name: str, namespace: Optional[str] = None
-    ) -> Dict[str, Any]:
-        """Return the data contained in the specified secret.
+    ) -> Optional[Dict[str, Any]]:
+        """Return the data contained in the specified secret, or None if it does not exist.
 
         Args:
             secret_name: name of the secret
@@ -142,6 +565,22 @@ class AbstractKubeInterface(WithLogging, metaclass=ABCMeta):
         """
         pass
 
+    @abstractmethod
+    def get_secrets(
+        self,
+        namespace: Optional[str] = None,
+        labels: Optional[LabelSelector] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return a list of secrets, represented as dictionary with decoded data.
+
+        Args:
+            namespace: namespace where to list the secrets. Default is to None, which will return the secrets in
+                       all namespaces
+            labels: filter to be applied to retrieve secrets which match certain labels, either as a list of
+                    "key=value" entries or as a mapping where a None value only requires the key.
+        """
+        pass
+
     @abstractmethod
     def set_label(
         self,
@@ -179,6 +618,27 @@ class AbstractKubeInterface(WithLogging, metaclass=ABCMeta):
 
         pass
 
+    @abstractmethod
+    def patch_labels(
+        self,
+        resource_type: KubernetesResourceType,
+        resource_name: str,
+        add: Optional[Mapping[str, str]] = None,
+        remove: Optional[Iterable[str]] = None,
+        namespace: Optional[str] = None,
+    ):
+        """Set and remove labels of a specified resource (type and name) in a single call.
+
+        Args:
+            resource_type: type of the resource to be labeled, e.g. service account, rolebindings, etc.
+            resource_name: name of the resource to be labeled
+            add: labels to be set, overwriting existing values
+            remove: keys of the labels to be removed. Labels that are not set are ignored.
+            namespace: namespace where the resource is
+        """
+
+        pass
+
     @abstractmethod
     def create(
         self,
@@ -202,6 +662,35 @@ class AbstractKubeInterface(WithLogging, metaclass=ABCMeta):
 
         pass
 
+    @abstractmethod
+    def apply_manifest(self, manifests: List[Dict[str, Any]]):
+        """Create or update a set of K8s resources in a single request.
+
+        Args:
+            manifests: full manifests of the resources, including kind, name, namespace and labels
+        """
+
+        pass
+
+    @abstractmethod
+    def create_secret(
+        self,
+        secret_name: str,
+        data: Dict[str, str],
+        namespace: Optional[str] = None,
+        labels: Optional[Dict[str, str]] = None,
+    ):
+        """Create a K8s secret from its data, with no intermediate file.
+
+        Args:
+            secret_name: name of the secret to be created
+            data: content of the secret, with base64-encoded values
+            namespace: namespace where the secret is
+            labels: labels to be set on the secret, as part of its creation
+        """
+
+        pass
+
     @abstractmethod
     def delete(
         self,
@@ -218,6 +707,23 @@ class AbstractKubeInterface(WithLogging, metaclass=ABCMeta):
         """
         pass
 
+    @abstractmethod
+    def delete_many(
+        self,
+        resources: List[Tuple[KubernetesResourceType, str]],
+        namespace: Optional[str] = None,
+    ):
+        """Delete a set of K8s resources of a namespace at once, ignoring those not found.
+
+        Args:
+            resources: type and name of the resources to be deleted
+            namespace: namespace where the resources are
+
+        Raises:
+            ValueError: when asked to delete a namespace
+        """
+        pass
+
     @abstractmethod
     def exists(
         self,
@@ -235,47 +741,66 @@ class AbstractKubeInterface(WithLogging, metaclass=ABCMeta):
         pass
 
     def select_by_master(self, master: str):
-        api_servers_clusters = {
-            name: cluster.server for name, cluster in self.kube_config.clusters.items()
-        }
+        config = self.kube_config
+        current_context = config.contexts.get(self.context_name)
+        current_cluster = (
+            config.clusters.get(current_context.cluster) if current_context else None
+        )
+        if current_cluster is not None and current_cluster.server == master:
+            return self
 
-        self.logger.debug(f"Clusters API: {dict(api_servers_clusters)}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Clusters API: %s", self._contexts_by_server)
 
-        contexts_for_api_server = [
-            name
-            for name, context in self.kube_config.contexts.items()
-            if api_servers_clusters[context.cluster] == master
-        ]
+        contexts_for_api_server = self._contexts_by_server.get(master, ())
 
         if len(contexts_for_api_server) == 0:
             raise AccountNotFound(master)
 
-        self.logger.info(
-            f"Contexts on api server {master}: {', '.join(contexts_for_api_server)}"
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Contexts on api server %s: %s",
+                master,
+                ", ".join(contexts_for_api_server),
+            )
 
-        return (
-            self
-            if self.context_name in contexts_for_api_server
-            else self.with_context(contexts_for_api_server[0])
-        )
+        return self.with_context(contexts_for_api_server[0])
 
 
 class LightKube(AbstractKubeInterface):
-    _obj_mapping: dict[KubernetesResourceType, Type[GlobalResource]] = MappingProxyType(
+    _labelable = frozenset(
         {
-            KubernetesResourceType.ROLE: Role,
-            KubernetesResourceType.SERVICEACCOUNT: LightKubeServiceAccount,
-            KubernetesResourceType.SECRET: Secret,
-            KubernetesResourceType.ROLEBINDING: RoleBinding,
-            KubernetesResourceType.SECRET_GENERIC: Secret,
-            KubernetesResourceType.NAMESPACE: Namespace,
+            KubernetesResourceType.SERVICEACCOUNT,
+            KubernetesResourceType.ROLE,
+            KubernetesResourceType.ROLEBINDING,
         }
     )
 
-    @cached_property
-    def client(self):
-        return Client(config=self.single_config)
+    @staticmethod
+    def _label_path(label_key: str) -> str:
+        """Return the JSON pointer (RFC 6901) to a label of a resource.
+
+        Args:
+            label_key: name of the label
+        """
+        return f"/metadata/labels/{label_key.replace('~', '~0').replace('/', '~1')}"
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _remove_label_patch(label_key: str) -> List[Dict[str, str]]:
+        """Return the JSON patch removing a label from a resource.
+
+        The patch is shared across calls, hence it must not be modified.
+
+        Args:
+            label_key: name of the label
+        """
+        return [{"op": "remove", "path": LightKube._label_path(label_key)}]
+
+    @property
+    def client(self) -> Client:
+        kube_config, context_name, _ = self._resolve_context()
+        return _lightkube_client(kube_config, context_name)
 
     def with_context(self, context_name: str):
         """Return a new KubeInterface object using a different context.
@@ -283,8 +808,16 @@ class LightKube(AbstractKubeInterface):
         Args:
             context_name: context to be used
         """
-        return LightKube(self.kube_config_file, self.defaults, context_name)
+        return self._share_state(
+            LightKube(
+                self.kube_config_file,
+                self.defaults,
+                context_name,
+                cache_ttl=self.cache_ttl,
+            )
+        )
 
+    @cached_resource(KubernetesResourceType.SERVICEACCOUNT)
     def get_service_account(
         self, account_id: str, namespace: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -309,93 +842,101 @@ class LightKube(AbstractKubeInterface):
         except Exception as e:
             raise e
 
-        with io.StringIO() as buffer:
-            codecs.dump_all_yaml([service_account], buffer)
-            buffer.seek(0)
-            return yaml.safe_load(buffer)
+        return service_account.to_dict()
 
     def get_service_accounts(
-        self, namespace: Optional[str] = None, labels: Optional[List[str]] = None
+        self,
+        namespace: Optional[str] = None,
+        labels: Optional[LabelSelector] = None,
     ) -> List[Dict[str, Any]]:
         """Return a list of service accounts, represented as dictionary.
 
         Args:
             namespace: namespace where to list the service accounts. Default is to None, which will return all service
                        account in all namespaces
-            labels: filter to be applied to retrieve service account which match certain labels.
+            labels: filter to be applied to retrieve service account which match certain labels, either as a
+                    list of "key=value" entries or as a mapping where a None value only requires the key.
         """
-        labels_to_pass = dict()
-        if labels:
-            for entry in labels:
-                if not PropertyFile.is_line_parsable(entry):
-                    continue
-                k, v = PropertyFile.parse_property_line(entry)
-                labels_to_pass[k] = v
+        return self._list(LightKubeServiceAccount, namespace, labels)
+
+    def get_secrets(
+        self,
+        namespace: Optional[str] = None,
+        labels: Optional[LabelSelector] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return a list of secrets, represented as dictionary with decoded data.
 
-        all_namespaces = []
+        Args:
+            namespace: namespace where to list the secrets. Default is to None, which will return the secrets in
+                       all namespaces
+            labels: filter to be applied to retrieve secrets which match certain labels, either as a list of
+                    "key=value" entries or as a mapping where a None value only requires the key.
+        """
+        return [
+            _decode_secret(secret) for secret in self._list(Secret, namespace, labels)
+        ]
 
-        if not namespace:
-            # means all namespaces
-            try:
-                iterator = self.client.list(
-                    res=Namespace,
+    def _list(
+        self,
+        res: Type[GlobalResource],
+        namespace: Optional[str],
+        labels: Optional[LabelSelector],
+    ) -> List[Dict[str, Any]]:
+        """Return the resources of a kind as dictionaries.
+
+        Args:
+            res: lightkube resource class
+            namespace: namespace where to list the resources. None lists them in all namespaces
+            labels: filter to be applied to retrieve resources which match certain labels
+        """
+        labels_to_pass = (
+            dict(labels)
+            if isinstance(labels, Mapping)
+            else dict(
+                filter(
+                    None, (PropertyFile.try_parse_line(entry) for entry in labels or ())
                 )
-                for ns in iterator:
-                    all_namespaces.append(ns.metadata.name)
-            except Exception:
-                all_namespaces.append(self.namespace)
+            )
+        )
 
-        else:
-            all_namespaces = [
-                namespace,
+        def list_namespace(namespace: str) -> List[Dict[str, Any]]:
+            return [
+                obj.to_dict()
+                for obj in self.client.list(
+                    res=res,
+                    namespace=namespace,
+                    labels=labels_to_pass,
+                )
             ]
 
-        result = []
-        for namespace in all_namespaces:
-            with io.StringIO() as buffer:
-                codecs.dump_all_yaml(
-                    self.client.list(
-                        res=LightKubeServiceAccount,
-                        namespace=namespace,
-                        labels=labels_to_pass,
-                    ),
-                    buffer,
-                )
-                buffer.seek(0)
-                result += list(yaml.safe_load_all(buffer))
+        if namespace:
+            return list_namespace(namespace)
 
-        return result
+        # list all namespaces within a single request, falling back to the
+        # current namespace when not allowed to list cluster-wide
+        try:
+            return list_namespace("*")
+        except ApiError:
+            return list_namespace(self.namespace)
 
+    @cached_resource(KubernetesResourceType.SECRET)
     def get_secret(
         self, secret_name: str, namespace: Optional[str] = None
-    ) -> Dict[str, Any]:
-        """Return the data contained in the specified secret.
+    ) -> Optional[Dict[str, Any]]:
+        """Return the data contained in the specified secret, or None if it does not exist.
 
         Args:
             secret_name: name of the secret
             namespace: namespace where the secret is contained
         """
         try:
-            with io.StringIO() as buffer:
-                codecs.dump_all_yaml(
-                    [
-                        self.client.get(
-                            res=Secret, namespace=namespace, name=secret_name
-                        )
-                    ],
-                    buffer,
-                )
-                buffer.seek(0)
-                secret = yaml.safe_load(buffer)
-
-                result = dict()
-                for k, v in secret["data"].items():
-                    result[k] = base64.b64decode(v).decode("utf-8")
+            secret = self.client.get(res=Secret, namespace=namespace, name=secret_name)
+        except ApiError as e:
+            if e.status.code == 404:
+                return None
+            raise e
 
-                secret["data"] = result
-                return secret
-        except Exception:
-            raise K8sResourceNotFound(secret_name, KubernetesResourceType.SECRET)
+        return _decode_secret(secret.to_dict())
 
     def set_label(
         self,
@@ -411,28 +952,39 @@ class LightKube(AbstractKubeInterface):
             resource_name: name of the resource to be labeled
             namespace: namespace where the resource is
         """
+        self._invalidate_cache(resource_type, resource_name)
+
+        label_key, label_value = label.split("=", 1)
+        patch = [
+            {
+                "op": "add",
+                "path": self._label_path(label_key),
+                "value": label_value,
+            }
+        ]
 
-        label_fragments = label.split("=")
-        patch = {"metadata": {"labels": {label_fragments[0]: label_fragments[1]}}}
+        if resource_type not in self._labelable:
+            raise NotImplementedError(
+                f"Label setting for resource name {resource_type} not supported yet."
+            )
 
-        if resource_type == KubernetesResourceType.SERVICEACCOUNT:
+        try:
             self.client.patch(
-                res=LightKubeServiceAccount,
+                res=_OBJ_MAPPING[resource_type],
                 name=resource_name,
                 namespace=namespace,
                 obj=patch,
+                patch_type=PatchType.JSON,
             )
-        elif resource_type == KubernetesResourceType.ROLE:
-            self.client.patch(
-                res=Role, name=resource_name, namespace=namespace, obj=patch
-            )
-        elif resource_type == KubernetesResourceType.ROLEBINDING:
+        except ApiError as e:
+            if e.status.code != 422:
+                raise e
+            # the resource has no labels yet, hence no /metadata/labels to add to
             self.client.patch(
-                res=RoleBinding, name=resource_name, namespace=namespace, obj=patch
-            )
-        else:
-            raise NotImplementedError(
-                f"Label setting for resource name {resource_type} not supported yet."
+                res=_OBJ_MAPPING[resource_type],
+                name=resource_name,
+                namespace=namespace,
+                obj={"metadata": {"labels": {label_key: label_value}}},
             )
 
     def remove_label(
@@ -450,45 +1002,66 @@ class LightKube(AbstractKubeInterface):
             label: label to remove
             namespace: namespace where the resource is
         """
-        label_to_remove = f"/metadata/labels/{label.replace('/', '~1')}"
-        self.logger.debug(f"Removing label {label_to_remove}")
-        patch = [{"op": "remove", "path": label_to_remove}]
+        self._invalidate_cache(resource_type, resource_name)
 
-        if resource_type == KubernetesResourceType.SERVICEACCOUNT:
-            self.client.patch(
-                res=LightKubeServiceAccount,
-                name=resource_name,
-                namespace=namespace,
-                obj=patch,
-                patch_type=PatchType.JSON,
-            )
-        elif resource_type == KubernetesResourceType.ROLE:
-            self.client.patch(
-                res=Role,
-                name=resource_name,
-                namespace=namespace,
-                obj=patch,
-                patch_type=PatchType.JSON,
-            )
-        elif resource_type == KubernetesResourceType.ROLEBINDING:
-            self.client.patch(
-                res=RoleBinding,
-                name=resource_name,
-                namespace=namespace,
-                obj=patch,
-                patch_type=PatchType.JSON,
+        self.logger.debug(f"Removing label {label}")
+        patch = self._remove_label_patch(label)
+
+        if resource_type not in self._labelable:
+            raise NotImplementedError(
+                f"Label setting for resource name {resource_type} not supported yet."
             )
-        else:
+
+        self.client.patch(
+            res=_OBJ_MAPPING[resource_type],
+            name=resource_name,
+            namespace=namespace,
+            obj=patch,
+            patch_type=PatchType.JSON,
+        )
+
+    def patch_labels(
+        self,
+        resource_type: KubernetesResourceType,
+        resource_name: str,
+        add: Optional[Mapping[str, str]] = None,
+        remove: Optional[Iterable[str]] = None,
+        namespace: Optional[str] = None,
+    ):
+        """Set and remove labels of a specified resource (type and name) in a single call.
+
+        Args:
+            resource_type: type of the resource to be labeled, e.g. service account, rolebindings, etc.
+            resource_name: name of the resource to be labeled
+            add: labels to be set, overwriting existing values
+            remove: keys of the labels to be removed. Labels that are not set are ignored.
+            namespace: namespace where the resource is
+        """
+        self._invalidate_cache(resource_type, resource_name)
+
+        if resource_type not in self._labelable:
             raise NotImplementedError(
                 f"Label setting for resource name {resource_type} not supported yet."
             )
 
+        # a merge patch needs no existing labels map, and null values remove labels
+        # whether they are set or not
+        self.client.patch(
+            res=_OBJ_MAPPING[resource_type],
+            name=resource_name,
+            namespace=namespace,
+            obj={
+                "metadata": {"labels": {**dict.fromkeys(remove or ()), **(add or {})}}
+            },
+            patch_type=PatchType.MERGE,
+        )
+
     def create_property_file_entries(self, property_file_name) -> Dict[str, str]:
-        entries = dict()
         props = PropertyFile.read(property_file_name).props
-        for k in props:
-            entries[k] = base64.b64encode(str(props[k]).encode("ascii"))
-        return props
+        return {
+            k: base64.b64encode(str(v).encode("utf-8")).decode("ascii")
+            for k, v in props.items()
+        }
 
     def create(
         self,
@@ -509,44 +1082,13 @@ class LightKube(AbstractKubeInterface):
                         e.g. {"resource" : ["pods", "configmaps"]} which would translate to something like
                         --resource=pods --resource=configmaps
         """
+        self._invalidate_cache(resource_type, resource_name)
 
         res = None
-        if resource_type == KubernetesResourceType.SERVICEACCOUNT:
-            with open(self.defaults.template_serviceaccount) as f:
-                res = codecs.load_all_yaml(
-                    f,
-                    context=filter_none(
-                        {
-                            "resourcename": resource_name,
-                            "namespace": namespace,
-                        }
-                        | extra_args
-                    ),
-                ).__getitem__(0)
-        elif resource_type == KubernetesResourceType.ROLE:
-            with open(self.defaults.template_role) as f:
-                res = codecs.load_all_yaml(
-                    f,
-                    context=filter_none(
-                        {
-                            "resourcename": resource_name,
-                            "namespace": namespace,
-                        }
-                        | extra_args
-                    ),
-                ).__getitem__(0)
-        elif resource_type == KubernetesResourceType.ROLEBINDING:
-            with open(self.defaults.template_rolebinding) as f:
-                res = codecs.load_all_yaml(
-                    f,
-                    context=filter_none(
-                        {
-                            "resourcename": resource_name,
-                            "namespace": namespace,
-                        }
-                        | extra_args
-                    ),
-                ).__getitem__(0)
+        if resource_type in _TEMPLATES:
+            res = _render_template(
+                self.defaults, resource_type, resource_name, namespace, **extra_args
+            )
         elif (
             resource_type == KubernetesResourceType.SECRET
             or resource_type == KubernetesResourceType.SECRET_GENERIC
@@ -557,7 +1099,7 @@ class LightKube(AbstractKubeInterface):
                         "apiVersion": "v1",
                         "kind": "Secret",
                         "metadata": {"name": resource_name, "namespace": namespace},
-                        "stringData": self.create_property_file_entries(
+                        "data": self.create_property_file_entries(
                             extra_args["from-env-file"]
                         ),
                     }
@@ -573,6 +1115,47 @@ class LightKube(AbstractKubeInterface):
 
         self.client.create(obj=res, name=resource_name, namespace=namespace)
 
+    def create_secret(
+        self,
+        secret_name: str,
+        data: Dict[str, str],
+        namespace: Optional[str] = None,
+        labels: Optional[Dict[str, str]] = None,
+    ):
+        """Create a K8s secret from its data, with no intermediate file.
+
+        Args:
+            secret_name: name of the secret to be created
+            data: content of the secret, with base64-encoded values
+            namespace: namespace where the secret is
+            labels: labels to be set on the secret, as part of its creation
+        """
+        self._invalidate_cache(KubernetesResourceType.SECRET, secret_name)
+
+        self.client.create(
+            Secret(
+                metadata=ObjectMeta(
+                    name=secret_name, namespace=namespace, labels=labels
+                ),
+                data=data,
+            ),
+            namespace=namespace,
+        )
+
+    def apply_manifest(self, manifests: List[Dict[str, Any]]):
+        """Create or update a set of K8s resources in a single request.
+
+        Args:
+            manifests: full manifests of the resources, including kind, name, namespace and labels
+        """
+        # resources are applied one by one, over the connection pool of the shared client
+        client = self.client
+        for manifest in manifests:
+            self._invalidate_cache(
+                manifest["kind"].lower(), manifest["metadata"]["name"]
+            )
+            client.apply(codecs.from_dict(manifest), field_manager=SPARK8S_LABEL)
+
     def delete(
         self,
         resource_type: KubernetesResourceType,
@@ -586,25 +1169,52 @@ class LightKube(AbstractKubeInterface):
             resource_name: name of the resource to be deleted
             namespace: namespace where the resource is
         """
-        if resource_type == KubernetesResourceType.SERVICEACCOUNT:
-            self.client.delete(
-                res=LightKubeServiceAccount, name=resource_name, namespace=namespace
+        self._invalidate_cache(resource_type, resource_name)
+
+        if resource_type not in _OBJ_MAPPING:
+            raise NotImplementedError(
+                f"Label setting for resource name {resource_type} not supported yet."
             )
-        elif resource_type == KubernetesResourceType.ROLE:
-            self.client.delete(res=Role, name=resource_name, namespace=namespace)
-        elif resource_type == KubernetesResourceType.ROLEBINDING:
-            self.client.delete(res=RoleBinding, name=resource_name, namespace=namespace)
-        elif (
-            resource_type == KubernetesResourceType.SECRET
-            or resource_type == KubernetesResourceType.SECRET_GENERIC
-        ):
-            self.client.delete(res=Secret, name=resource_name, namespace=namespace)
-        elif resource_type == KubernetesResourceType.NAMESPACE:
+
+        if resource_type == KubernetesResourceType.NAMESPACE:
             self.client.delete(res=Namespace, name=resource_name)
         else:
-            raise NotImplementedError(
-                f"Label setting for resource name {resource_type} not supported yet."
+            self.client.delete(
+                res=_OBJ_MAPPING[resource_type],
+                name=resource_name,
+                namespace=namespace,
+            )
+
+    def delete_many(
+        self,
+        resources: List[Tuple[KubernetesResourceType, str]],
+        namespace: Optional[str] = None,
+    ):
+        """Delete a set of K8s resources of a namespace at once, ignoring those not found.
+
+        Args:
+            resources: type and name of the resources to be deleted
+            namespace: namespace where the resources are
+
+        Raises:
+            ValueError: when asked to delete a namespace
+        """
+        resources = self._namespaced_resources(resources)
+
+        def delete(resource_type: KubernetesResourceType, resource_name: str):
+            try:
+                self.delete(resource_type, resource_name, namespace)
+            except ApiError as e:
+                if e.status.code != 404:
+                    raise e
+
+        # deletions are independent, hence they are issued concurrently over the shared client
+        run_concurrently(
+            *(
+                partial(delete, resource_type, resource_name)
+                for resource_type, resource_name in resources
             )
+        )
 
     def exists(
         self,
@@ -612,18 +1222,21 @@ class LightKube(AbstractKubeInterface):
         resource_name: str,
         namespace: Optional[str] = None,
     ) -> bool:
+        if namespace is not None and resource_type == KubernetesResourceType.NAMESPACE:
+            raise ValueError("Cannot pass namespace with resource_type Namespace")
+
         try:
-            if namespace is None:
-                obj = self.client.get(self._obj_mapping[resource_type], resource_name)
-            else:
-                if resource_type == KubernetesResourceType.NAMESPACE:
-                    raise ValueError(
-                        "Cannot pass namespace with resource_type Namespace"
-                    )
-                obj = self.client.get(
-                    self._obj_mapping[resource_type], resource_name, namespace=namespace
+            # select by name server-side, so that a missing resource is an empty
+            # list rather than an error response
+            return any(
+                True
+                for _ in self.client.list(
+                    _OBJ_MAPPING[resource_type],
+                    namespace=namespace,
+                    fields={"metadata.name": resource_name},
+                    chunk_size=1,
                 )
-            return obj is not None
+            )
 
         except ApiError as e:
             if "not found" in e.status.message:
@@ -631,65 +1244,414 @@ class LightKube(AbstractKubeInterface):
             raise e
 
 
+class KubectlProxy(WithLogging):
+    """Long-lived `kubectl proxy` process serving Kubernetes API calls over a pooled HTTP connection."""
+
+    _api_paths = MappingProxyType(
+        {
+            KubernetesResourceType.SERVICEACCOUNT: ("api/v1", "serviceaccounts"),
+            KubernetesResourceType.SECRET: ("api/v1", "secrets"),
+            KubernetesResourceType.SECRET_GENERIC: ("api/v1", "secrets"),
+            KubernetesResourceType.NAMESPACE: ("api/v1", "namespaces"),
+            KubernetesResourceType.ROLE: ("apis/rbac.authorization.k8s.io/v1", "roles"),
+            KubernetesResourceType.ROLEBINDING: (
+                "apis/rbac.authorization.k8s.io/v1",
+                "rolebindings",
+            ),
+        }
+    )
+
+    _serving_regex = re.compile(r"Starting to serve on .*:(\d+)\s*$")
+
+    # seconds to wait for the proxy to be serving, e.g. while credential plugins run
+    _startup_timeout = 30.0
+
+    _instances: Dict[Tuple[str, Optional[str], Optional[str]], "KubectlProxy"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(
+        self,
+        kubectl_cmd: str,
+        kube_config_file: Optional[str] = None,
+        context_name: Optional[str] = None,
+    ):
+        """Initialise the proxy. The kubectl process is only spawned on first use.
+
+        Args:
+            kubectl_cmd: kubectl command used to spawn the proxy
+            kube_config_file: kube config path
+            context_name: name of the context to be used
+        """
+        self.kubectl_cmd = kubectl_cmd
+        self.kube_config_file = kube_config_file
+        self.context_name = context_name
+        self._process: Optional[subprocess.Popen] = None
+        self._stderr: Optional[IO[bytes]] = None
+        self._session: Optional[httpx.Client] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_config(
+        cls,
+        kubectl_cmd: str,
+        kube_config_file: Optional[str] = None,
+        context_name: Optional[str] = None,
+    ) -> "KubectlProxy":
+        """Return the proxy shared by all the interfaces using the same kubectl command, config and context."""
+        key = (kubectl_cmd, kube_config_file, context_name)
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(kubectl_cmd, kube_config_file, context_name)
+                atexit.register(cls._instances[key].close)
+            return cls._instances[key]
+
+    def _ensure_proxy(self) -> httpx.Client:
+        """Spawn the proxy process if not running and return the session bound to it."""
+        with self._lock:
+            if self._process is not None and self._process.poll() is None:
+                return self._session
+
+            cmd = shlex.split(self.kubectl_cmd)
+            if self.kube_config_file:
+                cmd += ["--kubeconfig", self.kube_config_file]
+            if self.context_name:
+                cmd += ["--context", self.context_name]
+            cmd += ["proxy", "--port=0"]
+
+            self.logger.debug(f"Starting kubectl proxy: {' '.join(cmd)}")
+
+            # kubectl keeps logging to stderr while serving: spool it to a file rather
+            # than to a pipe that nobody reads, which would eventually block the proxy
+            stderr = TemporaryFile()
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=stderr,
+                text=True,
+            )
+
+            first_line: List[str] = []
+            reader = threading.Thread(
+                target=lambda: first_line.append(process.stdout.readline()),
+                daemon=True,
+            )
+            reader.start()
+            reader.join(self._startup_timeout)
+            timed_out = reader.is_alive()
+
+            match = None if timed_out else self._serving_regex.search(first_line[0])
+            if match is None:
+                process.kill()
+                process.wait()
+                stderr.seek(0)
+                error = stderr.read().decode("utf-8", errors="replace").strip()
+                stderr.close()
+                raise RuntimeError(
+                    f"kubectl proxy not serving after {self._startup_timeout}s: {error}"
+                    if timed_out
+                    else f"Cannot start kubectl proxy: {error}"
+                )
+
+            if self._session is not None:
+                self._session.close()
+            if self._stderr is not None:
+                self._stderr.close()
+
+            self._process = process
+            self._stderr = stderr
+            self._session = httpx.Client(
+                base_url=f"http://127.0.0.1:{match.group(1)}",
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=4),
+            )
+
+            return self._session
+
+    def get(
+        self,
+        resource_type: KubernetesResourceType,
+        resource_name: str,
+        namespace: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Return the specified resource, represented as dictionary, or None if it does not exist.
+
+        Args:
+            resource_type: type of the resource to be retrieved, e.g. service account, secrets, etc.
+            resource_name: name of the resource to be retrieved
+            namespace: namespace where the resource is. Ignored for cluster-wide resources.
+        """
+        response = self._ensure_proxy().get(
+            self._path(resource_type, resource_name, namespace)
+        )
+
+        if response.status_code == 404:
+            return None
+
+        response.raise_for_status()
+        return response.json()
+
+    def delete(
+        self,
+        resource_type: KubernetesResourceType,
+        resource_name: str,
+        namespace: Optional[str] = None,
+    ) -> bool:
+        """Delete the specified resource. Return False if it did not exist.
+
+        Args:
+            resource_type: type of the resource to be deleted, e.g. service account, secrets, etc.
+            resource_name: name of the resource to be deleted
+            namespace: namespace where the resource is. Ignored for cluster-wide resources.
+        """
+        response = self._ensure_proxy().delete(
+            self._path(resource_type, resource_name, namespace)
+        )
+
+        if response.status_code == 404:
+            return False
+
+        response.raise_for_status()
+        return True
+
+    def patch_labels(
+        self,
+        resource_type: KubernetesResourceType,
+        resource_name: str,
+        labels: Mapping[str, Optional[str]],
+        namespace: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Set or remove labels of the specified resource with a single merge patch.
+
+        Args:
+            resource_type: type of the resource to be labeled, e.g. service account, rolebindings, etc.
+            resource_name: name of the resource to be labeled
+            labels: labels to be set, a None value removing the label
+            namespace: namespace where the resource is. Ignored for cluster-wide resources.
+        """
+        response = self._ensure_proxy().patch(
+            self._path(resource_type, resource_name, namespace),
+            content=json.dumps({"metadata": {"labels": dict(labels)}}),
+            headers={"Content-Type": "application/merge-patch+json"},
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def _path(
+        self,
+        resource_type: KubernetesResourceType,
+        resource_name: str,
+        namespace: Optional[str],
+    ) -> str:
+        group, plural = self._api_paths[resource_type]
+
+        if resource_type == KubernetesResourceType.NAMESPACE:
+            return f"/{group}/{plural}/{resource_name}"
+        return f"/{group}/namespaces/{namespace or 'default'}/{plural}/{resource_name}"
+
+    def close(self):
+        """Close the session and terminate the proxy process."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+            if self._process is not None:
+                self._process.terminate()
+                try:
+                    self._process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    self._process.kill()
+                self._process = None
+            if self._stderr is not None:
+                self._stderr.close()
+                self._stderr = None
+
+
 class KubeInterface(AbstractKubeInterface):
     """Class for providing an interface for k8s API needed for the spark client."""
 
+    READ_BACKENDS = ("kubectl", "lightkube", "auto", "proxy")
+
+    def __init__(
+        self,
+        kube_config_file: Union[None, str, Dict[str, Any]],
+        defaults: Defaults,
+        context_name: Optional[str] = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        read_backend: str = "kubectl",
+    ):
+        """Initialise a KubeInterface class from a kube config file.
+
+        Args:
+            kube_config_file: kube config path
+            context_name: name of the context to be used
+            cache_ttl: number of seconds retrieved service accounts and secrets are cached for.
+                       Non-positive values, the default, disable caching. Changes made outside
+                       of this interface are not seen until the cached entries expire.
+            read_backend: backend used for single-resource reads (get_service_account, get_secret and
+                          exists). "kubectl" spawns a kubectl process for every read, "lightkube" serves
+                          them in-process through the Kubernetes API, "auto" uses lightkube whenever the
+                          kube config can be loaded by it and falls back to kubectl otherwise, "proxy"
+                          sends them through a single long-lived `kubectl proxy` process. With "proxy",
+                          deletions and label changes also go through the proxy.
+        """
+        if read_backend not in self.READ_BACKENDS:
+            raise ValueError(
+                f"Unsupported read backend {read_backend}. "
+                f"Allowed values are: {', '.join(self.READ_BACKENDS)}"
+            )
+        super().__init__(kube_config_file, defaults, context_name, cache_ttl=cache_ttl)
+        self.read_backend = read_backend
+        self._cmd_prefixes: Dict[
+            Tuple[Optional[str], Optional[str]], Tuple[str, ...]
+        ] = {}
+
     @cached_property
     def kubectl_cmd(self):
         return self.defaults.kubectl_cmd
 
+    @cached_property
+    def _proxy(self) -> Optional[KubectlProxy]:
+        """Shared kubectl proxy used for reads, deletions and labels, None when not using the proxy backend."""
+        if self.read_backend != "proxy":
+            return None
+
+        return KubectlProxy.for_config(
+            self.kubectl_cmd,
+            self.kube_config_file if isinstance(self.kube_config_file, str) else None,
+            self.context_name,
+        )
+
+    @cached_property
+    def _reader(self) -> Optional[LightKube]:
+        """In-process client used for reads, None when reads go through kubectl."""
+        if self.read_backend in ("kubectl", "proxy"):
+            return None
+
+        reader = LightKube(
+            self.kube_config_file, self.defaults, self._context_name, cache_ttl=0
+        )
+
+        if self.read_backend == "auto":
+            try:
+                reader.client
+            except Exception as e:
+                self.logger.debug(
+                    f"Cannot use lightkube for reads, falling back to kubectl: {e}"
+                )
+                return None
+
+        return reader
+
     def with_context(self, context_name: str):
         """Return a new KubeInterface object using a different context.
 
         Args:
             context_name: context to be used
         """
-        return KubeInterface(self.kube_config_file, self.defaults, context_name)
+        return self._share_state(
+            KubeInterface(
+                self.kube_config_file,
+                self.defaults,
+                context_name,
+                cache_ttl=self.cache_ttl,
+                read_backend=self.read_backend,
+            )
+        )
+
+    _namespace_flags = frozenset({"-n", "--namespace", "-A", "--all-namespaces"})
+
+    def _cmd_prefix(
+        self, namespace: Optional[str], context: Optional[str]
+    ) -> Tuple[str, ...]:
+        """Return the kubectl invocation prefix, as argument list, for the given namespace and context.
+
+        Args:
+            namespace: namespace flag to be added, if any
+            context: context flag to be added, if any
+        """
+        key = (namespace, context)
+        if key not in self._cmd_prefixes:
+            cmd_list = shlex.split(self.kubectl_cmd)
+            if self.kube_config_file:
+                cmd_list += ["--kubeconfig", str(self.kube_config_file)]
+            if namespace:
+                cmd_list += ["--namespace", namespace]
+            if context:
+                cmd_list += ["--context", context]
+            self._cmd_prefixes[key] = tuple(cmd_list)
+        return self._cmd_prefixes[key]
 
     def exec(
         self,
-        cmd: str,
+        cmd: Union[str, List[str]],
         namespace: Optional[str] = None,
         context: Optional[str] = None,
         output: Optional[str] = None,
-    ) -> Union[str, Dict[str, Any]]:
-        """Execute command provided as a string.
+        stream: bool = False,
+        input: Optional[str] = None,
+    ) -> Union[str, Dict[str, Any], Iterator[Dict[str, Any]]]:
+        """Execute kubectl command provided as a string or as a list of arguments.
+
+        The command is run directly, without going through a shell.
 
         Args:
-            cmd: string command to be executed
+            cmd: kubectl command to be executed, without the kubectl executable and global flags
             namespace: namespace where the command will be executed. If None the exec command will
                 executed with no namespace information
             context: context to be used
-            output: format for the output of the command. If "yaml" is used, output is returned as a dictionary.
+            output: format for the output of the command. Default is "json". If "json" or "yaml" is used, output is
+                returned as a dictionary.
+            stream: for list commands with "json" output, lazily yield the listed items while kubectl output is
+                being read, rather than buffering and parsing the whole response.
+            input: text to be written to the standard input of kubectl, e.g. a manifest for "-f -"
 
         Raises:
             CalledProcessError: when the bash command fails and exits with code other than 0
 
         Returns:
-            Output of the command, either parsed as yaml or string
+            Output of the command, either parsed as json/yaml, string or iterator over the listed items
         """
 
-        cmd_list = [self.kubectl_cmd]
-        if self.kube_config_file:
-            cmd_list += [f"--kubeconfig {self.kube_config_file}"]
+        args = shlex.split(cmd) if isinstance(cmd, str) else cmd
 
-        if namespace and "--namespace" not in cmd or "-n" not in cmd:
-            cmd_list += [f"--namespace {namespace}"]
-        if self.kube_config_file and "--context" not in cmd:
-            cmd_list += [f"--context {context or self.context_name}"]
+        flags = {token.split("=", 1)[0] for token in args if token.startswith("-")}
 
-        cmd_list += [cmd, f"-o {output or 'yaml'}"]
+        if not flags.isdisjoint(self._namespace_flags):
+            namespace = None
+        if self.kube_config_file and "--context" not in flags:
+            context = context or self.context_name
+        else:
+            context = None
 
-        base_cmd = " ".join(cmd_list)
+        output = output or "json"
 
-        self.logger.debug(f"Executing command: {base_cmd}")
+        base_cmd = [*self._cmd_prefix(namespace, context), *args, "-o", output]
 
-        return (
-            parse_yaml_shell_output(base_cmd)
-            if (output is None) or (output == "yaml")
-            else execute_command_output(base_cmd)
-        )
+        self.logger.debug(f"Executing command: {shlex.join(base_cmd)}")
+
+        if output == "json" and stream:
+            return stream_json_shell_items(base_cmd)
+        elif output == "json":
+            return parse_json_shell_output(base_cmd, input)
+        elif output == "yaml":
+            return parse_yaml_shell_output(base_cmd, input)
+        else:
+            return execute_command_output(base_cmd, input)
+
+    @staticmethod
+    def _label_selector_flag(labels: Optional[LabelSelector]) -> str:
+        """Return the kubectl label selector flag, with a leading space, or an empty string.
 
+        Args:
+            labels: label selector, as list of "key=value" entries or as mapping
+        """
+        if isinstance(labels, Mapping):
+            labels = [
+                key if value is None else f"{key}={value}"
+                for key, value in labels.items()
+            ]
+        return f" -l {','.join(labels)}" if labels else ""
+
+    @cached_resource(KubernetesResourceType.SERVICEACCOUNT)
     def get_service_account(
         self, account_id: str, namespace: str = "default"
     ) -> Dict[str, Any]:
@@ -698,6 +1660,18 @@ class KubeInterface(AbstractKubeInterface):
         Args:
             namespace: namespace where to look for the service account. Default is 'default'
         """
+        if self._reader is not None:
+            return self._reader.get_service_account(account_id, namespace)
+
+        if self._proxy is not None:
+            service_account = self._proxy.get(
+                KubernetesResourceType.SERVICEACCOUNT, account_id, namespace
+            )
+            if service_account is None:
+                raise K8sResourceNotFound(
+                    account_id, KubernetesResourceType.SERVICEACCOUNT
+                )
+            return service_account
 
         cmd = f"get serviceaccount {account_id}"
 
@@ -720,61 +1694,88 @@ class KubeInterface(AbstractKubeInterface):
         return service_account_raw
 
     def get_service_accounts(
-        self, namespace: Optional[str] = None, labels: Optional[List[str]] = None
+        self,
+        namespace: Optional[str] = None,
+        labels: Optional[LabelSelector] = None,
     ) -> List[Dict[str, Any]]:
         """Return a list of service accounts, represented as dictionary.
 
         Args:
             namespace: namespace where to list the service accounts. Default is to None, which will return all service
                        account in all namespaces
-            labels: filter to be applied to retrieve service account which match certain labels.
+            labels: filter to be applied to retrieve service account which match certain labels, either as a
+                    list of "key=value" entries or as a mapping where a None value only requires the key.
         """
-        cmd = "get serviceaccount"
-
-        if labels is not None and len(labels) > 0:
-            cmd += " ".join([f" -l {label}" for label in labels])
+        # retrieve the whole list in a single request rather than in paginated chunks
+        cmd = f"get serviceaccount{self._label_selector_flag(labels)} --chunk-size=0"
 
         if namespace:
-            all_service_accounts_raw = self.exec(cmd, namespace=namespace)
-        else:
-            try:
-                all_service_accounts_raw = self.exec(f"{cmd} -A", namespace=None)
-            except subprocess.CalledProcessError:
-                all_service_accounts_raw = self.exec(cmd, namespace=self.namespace)
-
-        if isinstance(all_service_accounts_raw, str):
-            raise ValueError("Malformed output")
+            return list(self.exec(cmd, namespace=namespace, stream=True))
 
-        return all_service_accounts_raw["items"]
+        try:
+            return list(self.exec(f"{cmd} -A", namespace=None, stream=True))
+        except subprocess.CalledProcessError:
+            return list(self.exec(cmd, namespace=self.namespace, stream=True))
 
+    @cached_resource(KubernetesResourceType.SECRET)
     def get_secret(
         self, secret_name: str, namespace: Optional[str] = None
-    ) -> Dict[str, Any]:
-        """Return the data contained in the specified secret.
+    ) -> Optional[Dict[str, Any]]:
+        """Return the data contained in the specified secret, or None if it does not exist.
 
         Args:
             secret_name: name of the secret
             namespace: namespace where the secret is contained
         """
-        try:
+        if self._reader is not None:
+            return self._reader.get_secret(secret_name, namespace or self.namespace)
+
+        if self._proxy is not None:
+            secret = self._proxy.get(
+                KubernetesResourceType.SECRET,
+                secret_name,
+                namespace or self.namespace,
+            )
+        else:
+            # with --ignore-not-found, kubectl prints nothing for missing secrets
             secret = self.exec(
                 f"get secret {secret_name} --ignore-not-found",
                 namespace=namespace or self.namespace,
             )
-        except Exception:
-            raise K8sResourceNotFound(secret_name, KubernetesResourceType.SECRET)
 
-        if secret is None or len(secret) == 0 or isinstance(secret, str):
-            raise K8sResourceNotFound(secret_name, KubernetesResourceType.SECRET)
+        if not secret or isinstance(secret, str):
+            return None
+
+        return _decode_secret(secret)
+
+    def get_secrets(
+        self,
+        namespace: Optional[str] = None,
+        labels: Optional[LabelSelector] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return a list of secrets, represented as dictionary with decoded data.
+
+        Args:
+            namespace: namespace where to list the secrets. Default is to None, which will return the secrets in
+                       all namespaces
+            labels: filter to be applied to retrieve secrets which match certain labels, either as a list of
+                    "key=value" entries or as a mapping where a None value only requires the key.
+        """
+        cmd = f"get secret{self._label_selector_flag(labels)} --chunk-size=0"
+
+        def list_secrets(cmd: str, namespace: Optional[str]):
+            return [
+                _decode_secret(secret)
+                for secret in self.exec(cmd, namespace=namespace, stream=True)
+            ]
 
-        result = dict()
-        for k, v in secret["data"].items():
-            # k1 = k.replace(".", "\\.")
-            # value = self.kube_interface.exec(f"get secret {secret_name}", output=f"jsonpath='{{.data.{k1}}}'")
-            result[k] = base64.b64decode(v).decode("utf-8")
+        if namespace:
+            return list_secrets(cmd, namespace)
 
-        secret["data"] = result
-        return secret
+        try:
+            return list_secrets(f"{cmd} -A", None)
+        except subprocess.CalledProcessError:
+            return list_secrets(cmd, self.namespace)
 
     def set_label(
         self,
@@ -790,6 +1791,18 @@ class KubeInterface(AbstractKubeInterface):
             resource_name: name of the resource to be labeled
             namespace: namespace where the resource is
         """
+        self._invalidate_cache(resource_type, resource_name)
+
+        if self._proxy is not None:
+            label_key, label_value = label.split("=", 1)
+            self._proxy.patch_labels(
+                resource_type,
+                resource_name,
+                {label_key: label_value},
+                namespace or self.namespace,
+            )
+            return
+
         self.exec(
             f"label {resource_type} {resource_name} {label}",
             namespace=namespace or self.namespace,
@@ -802,11 +1815,62 @@ class KubeInterface(AbstractKubeInterface):
         label: str,
         namespace: Optional[str] = None,
     ):
+        self._invalidate_cache(resource_type, resource_name)
+
+        if self._proxy is not None:
+            self._proxy.patch_labels(
+                resource_type,
+                resource_name,
+                {label: None},
+                namespace or self.namespace,
+            )
+            return
+
         self.exec(
             f"label {resource_type} {resource_name} {label}-",
             namespace=namespace or self.namespace,
         )
 
+    def patch_labels(
+        self,
+        resource_type: str,
+        resource_name: str,
+        add: Optional[Mapping[str, str]] = None,
+        remove: Optional[Iterable[str]] = None,
+        namespace: Optional[str] = None,
+    ):
+        """Set and remove labels of a specified resource (type and name) in a single call.
+
+        Args:
+            resource_type: type of the resource to be labeled, e.g. service account, rolebindings, etc.
+            resource_name: name of the resource to be labeled
+            add: labels to be set, overwriting existing values
+            remove: keys of the labels to be removed. Labels that are not set are ignored.
+            namespace: namespace where the resource is
+        """
+        self._invalidate_cache(resource_type, resource_name)
+
+        if self._proxy is not None:
+            self._proxy.patch_labels(
+                resource_type,
+                resource_name,
+                {**dict.fromkeys(remove or ()), **(add or {})},
+                namespace or self.namespace,
+            )
+            return
+
+        self.exec(
+            [
+                "label",
+                *resource_type.split(),
+                resource_name,
+                "--overwrite",
+                *(f"{key}={value}" for key, value in (add or {}).items()),
+                *(f"{key}-" for key in remove or ()),
+            ],
+            namespace=namespace or self.namespace,
+        )
+
     def create(
         self,
         resource_type: str,
@@ -826,29 +1890,82 @@ class KubeInterface(AbstractKubeInterface):
                         e.g. {"resource" : ["pods", "configmaps"]} which would translate to something like
                         --resource=pods --resource=configmaps
         """
+        self._invalidate_cache(resource_type, resource_name)
         if resource_type == KubernetesResourceType.NAMESPACE:
-            self.exec(
-                f"create {resource_type} {resource_name}", namespace=None, output="name"
-            )
+            args = ["create", *resource_type.split(), resource_name]
+            namespace = None
         else:
             # NOTE: removing 'username' to avoid interference with KUBECONFIG
             # ERROR: more than one authentication method found for admin; found [token basicAuth], only one is allowed
             # See for similar:
             # https://stackoverflow.com/questions/53783871/get-error-more-than-one-authentication-method-found-for-tier-two-user-found
-            formatted_extra_args = " ".join(
-                [
+            args = [
+                "create",
+                *resource_type.split(),
+                resource_name,
+                *(
                     f"--{k}={v}"
                     for k, values in extra_args.items()
                     if k != "username"
                     for v in listify(values)
-                ]
-            )
-            self.exec(
-                f"create {resource_type} {resource_name} {formatted_extra_args}",
-                namespace=namespace or self.namespace,
-                output="name",
+                ),
+            ]
+            namespace = namespace or self.namespace
+
+        self.exec(args, namespace=namespace, output="name")
+
+    def create_secret(
+        self,
+        secret_name: str,
+        data: Dict[str, str],
+        namespace: Optional[str] = None,
+        labels: Optional[Dict[str, str]] = None,
+    ):
+        """Create a K8s secret from its data, with no intermediate file.
+
+        Args:
+            secret_name: name of the secret to be created
+            data: content of the secret, with base64-encoded values
+            namespace: namespace where the secret is
+            labels: labels to be set on the secret, as part of its creation
+        """
+        self._invalidate_cache(KubernetesResourceType.SECRET, secret_name)
+
+        metadata: Dict[str, Any] = {"name": secret_name}
+        if labels:
+            metadata["labels"] = labels
+
+        self.exec(
+            ["create", "-f", "-"],
+            namespace=namespace or self.namespace,
+            output="name",
+            input=json.dumps(
+                {
+                    "apiVersion": "v1",
+                    "kind": "Secret",
+                    "metadata": metadata,
+                    "data": data,
+                }
+            ),
+        )
+
+    def apply_manifest(self, manifests: List[Dict[str, Any]]):
+        """Create or update a set of K8s resources in a single request.
+
+        Args:
+            manifests: full manifests of the resources, including kind, name, namespace and labels
+        """
+        for manifest in manifests:
+            self._invalidate_cache(
+                manifest["kind"].lower(), manifest["metadata"]["name"]
             )
 
+        self.exec(
+            ["apply", "-f", "-"],
+            output="name",
+            input=yaml.safe_dump_all(manifests),
+        )
+
     def delete(
         self, resource_type: str, resource_name: str, namespace: Optional[str] = None
     ):
@@ -859,23 +1976,86 @@ class KubeInterface(AbstractKubeInterface):
             resource_name: name of the resource to be deleted
             namespace: namespace where the resource is
         """
+        self._invalidate_cache(resource_type, resource_name)
+
+        if self._proxy is not None:
+            self._proxy.delete(
+                resource_type, resource_name, namespace or self.namespace
+            )
+            return
+
         self.exec(
             f"delete {resource_type} {resource_name} --ignore-not-found",
             namespace=namespace or self.namespace,
             output="name",
         )
 
+    def delete_many(
+        self,
+        resources: List[Tuple[KubernetesResourceType, str]],
+        namespace: Optional[str] = None,
+    ):
+        """Delete a set of K8s resources of a namespace at once, ignoring those not found.
+
+        Args:
+            resources: type and name of the resources to be deleted
+            namespace: namespace where the resources are
+
+        Raises:
+            ValueError: when asked to delete a namespace
+        """
+        resources = self._namespaced_resources(resources)
+
+        for resource_type, resource_name in resources:
+            self._invalidate_cache(resource_type, resource_name)
+
+        namespace = namespace or self.namespace
+
+        if self._proxy is not None:
+            run_concurrently(
+                *(
+                    partial(self._proxy.delete, resource_type, resource_name, namespace)
+                    for resource_type, resource_name in resources
+                )
+            )
+            return
+
+        self.exec(
+            [
+                "delete",
+                *(
+                    "/".join((resource_type, resource_name))
+                    for resource_type, resource_name in resources
+                ),
+                "--ignore-not-found",
+            ],
+            namespace=namespace,
+            output="name",
+        )
+
     def exists(
         self,
         resource_type: KubernetesResourceType,
         resource_name: str,
         namespace: Optional[str] = None,
     ) -> bool:
+        if self._reader is not None:
+            return self._reader.exists(resource_type, resource_name, namespace)
+
+        if self._proxy is not None:
+            return (
+                self._proxy.get(
+                    resource_type, resource_name, namespace or self.namespace
+                )
+                is not None
+            )
+
         output = self.exec(
             f"get {resource_type} {resource_name} --ignore-not-found",
             namespace=namespace or self.namespace,
+            output="name",
         )
-        return output is not None
+        return bool(output.strip())
 
     @classmethod
     def autodetect(
@@ -889,12 +2069,11 @@ class KubeInterface(AbstractKubeInterface):
             defaults: defaults coming from env variable
         """
 
-        cmd = defaults.kubectl_cmd
-
-        if context_name:
-            cmd += f" --context {context_name}"
-
-        config = parse_yaml_shell_output(f"{cmd} config view --raw --minify -o yaml")
+        config = _autodetect_config(
+            context_name,
+            defaults.kubectl_cmd,
+            _kube_config_mtimes(defaults.kube_config),
+        )
 
         return KubeInterface(config, defaults=defaults, context_name=context_name)
 
@@ -946,27 +2125,30 @@ class AbstractServiceAccountRegistry(WithLogging, ABC):
 
     def get_primary(self, namespace: Optional[str] = None) -> Optional[ServiceAccount]:
         """Return the primary service account. None is there is no primary service account."""
-        all_accounts = self.all(namespace)
+        primary_accounts = self._primary_accounts(namespace)
 
-        if len(all_accounts) == 0:
-            self.logger.warning("There are no service account available.")
-            return None
-
-        primary_accounts = [
-            account for account in all_accounts if account.primary is True
-        ]
-        if len(primary_accounts) == 0:
+        primary_account = next(primary_accounts, None)
+        if primary_account is None:
             self.logger.warning("There are no primary service account available.")
             return None
 
-        if len(primary_accounts) > 1:
+        other_account = next(primary_accounts, None)
+        if other_account is not None:
+            names = [primary_account.name, other_account.name] + [
+                account.name for account in primary_accounts
+            ]
             self.logger.warning(
-                f"More than one account was found: {','.join([account.name for account in primary_accounts])}. "
-                f"Choosing the first: {primary_accounts[0].name}. "
+                f"More than one account was found: {','.join(names)}. "
+                f"Choosing the first: {primary_account.name}. "
                 "Note that this may lead to un-expected behaviour if the other primary is chosen"
             )
 
-        return primary_accounts[0]
+        return primary_account
+
+    def _primary_accounts(
+        self, namespace: Optional[str] = None
+    ) -> Iterator[ServiceAccount]:
+        return (account for account in self.all(namespace) if account.primary is True)
 
     @abstractmethod
     def get(self, account_id: str) -> Optional[ServiceAccount]:
@@ -988,14 +2170,39 @@ class K8sServiceAccountRegistry(AbstractServiceAccountRegistry):
 
     def all(self, namespace: Optional[str] = None) -> List["ServiceAccount"]:
         """Return all existing service accounts."""
-        service_accounts = self.kube_interface.get_service_accounts(
-            namespace=namespace, labels=[f"{MANAGED_BY_LABELNAME}={SPARK8S_LABEL}"]
+        # service accounts and configuration secrets are listed concurrently
+        service_accounts, configurations = run_concurrently(
+            partial(
+                self.kube_interface.get_service_accounts,
+                namespace=namespace,
+                labels={MANAGED_BY_LABELNAME: SPARK8S_LABEL},
+            ),
+            partial(self._list_account_configurations, namespace),
         )
+        api_server = self.kube_interface.api_server
         return [
-            self._build_service_account_from_raw(raw["metadata"])
+            self._build_service_account_from_raw(
+                raw["metadata"], configurations=configurations, api_server=api_server
+            )
             for raw in service_accounts
         ]
 
+    def _primary_accounts(
+        self, namespace: Optional[str] = None
+    ) -> Iterator[ServiceAccount]:
+        # let the API server select the primary accounts, and only fetch the
+        # configuration secrets of the accounts actually consumed
+        service_accounts = self.kube_interface.get_service_accounts(
+            namespace=namespace,
+            labels={MANAGED_BY_LABELNAME: SPARK8S_LABEL, PRIMARY_LABELNAME: None},
+        )
+        api_server = self.kube_interface.api_server
+        return (
+            self._build_service_account_from_raw(raw["metadata"], api_server=api_server)
+            for raw in service_accounts
+            if PRIMARY_LABELNAME in raw["metadata"]["labels"]
+        )
+
     @staticmethod
     def _get_secret_name(name):
         return f"{SPARK8S_LABEL}-sa-conf-{name}"
@@ -1005,31 +2212,66 @@ class K8sServiceAccountRegistry(AbstractServiceAccountRegistry):
     ) -> PropertyFile:
         secret_name = self._get_secret_name(name)
 
-        try:
-            secret = self.kube_interface.get_secret(secret_name, namespace=namespace)[
-                "data"
-            ]
-        except Exception:
+        secret = self.kube_interface.get_secret(secret_name, namespace=namespace)
+
+        if secret is None:
             return PropertyFile.empty()
 
-        return PropertyFile(
-            {
-                self._kubernetes_key_serializer.deserialize(key): value
-                for key, value in secret.items()
-            }
-        )
+        return self._parse_account_configurations(secret["data"])
+
+    def _list_account_configurations(
+        self, namespace: Optional[str] = None
+    ) -> Dict[Tuple[str, str], PropertyFile]:
+        """Return the configurations stored in labelled secrets, indexed by secret namespace and name.
+
+        Args:
+            namespace: namespace where to list the secrets. None lists them in all namespaces
+        """
+        try:
+            secrets = self.kube_interface.get_secrets(
+                namespace=namespace, labels={MANAGED_BY_LABELNAME: SPARK8S_LABEL}
+            )
+        except Exception as e:
+            self.logger.debug(e)
+            return {}
+
+        return {
+            (
+                secret["metadata"]["namespace"],
+                secret["metadata"]["name"],
+            ): self._parse_account_configurations(secret["data"])
+            for secret in secrets
+        }
 
-    def _build_service_account_from_raw(self, metadata: Dict[str, Any]):
+    def _parse_account_configurations(self, data: Dict[str, str]) -> PropertyFile:
+        return PropertyFile(self._kubernetes_key_serializer.deserialize_keys(data))
+
+    def _build_service_account_from_raw(
+        self,
+        metadata: Dict[str, Any],
+        configurations: Optional[Mapping[Tuple[str, str], PropertyFile]] = None,
+        api_server: Optional[str] = None,
+    ):
         name = metadata["name"]
         namespace = metadata["namespace"]
         primary = PRIMARY_LABELNAME in metadata["labels"]
 
+        # configurations that were not listed beforehand, e.g. stored in secrets
+        # created before they were labelled, are only fetched when accessed
+        extra_confs = (configurations or {}).get(
+            (namespace, self._get_secret_name(name))
+        )
+        if extra_confs is None:
+            extra_confs = LazyPropertyFile(
+                lambda: self._retrieve_account_configurations(name, namespace).props
+            )
+
         return ServiceAccount(
             name=name,
             namespace=namespace,
             primary=primary,
-            api_server=self.kube_interface.api_server,
-            extra_confs=self._retrieve_account_configurations(name, namespace),
+            api_server=api_server or self.kube_interface.api_server,
+            extra_confs=extra_confs,
         )
 
     def set_primary(
@@ -1041,43 +2283,59 @@ class K8sServiceAccountRegistry(AbstractServiceAccountRegistry):
             account_id: account id to be elected as new primary account
         """
 
-        # Relabeling primary
-        primary_account = self.get_primary(namespace)
-
-        if primary_account is not None:
-            self.kube_interface.remove_label(
-                KubernetesResourceType.SERVICEACCOUNT,
-                primary_account.name,
-                f"{PRIMARY_LABELNAME}",
-                primary_account.namespace,
-            )
-            self.kube_interface.remove_label(
-                KubernetesResourceType.ROLEBINDING,
-                f"{primary_account.name}-role-binding",
-                f"{PRIMARY_LABELNAME}",
-                primary_account.namespace,
-            )
-
-        service_account = self.get(account_id)
+        metadata = self._get_metadata(account_id)
 
-        if service_account is None:
+        if metadata is None:
             raise AccountNotFound(account_id)
 
-        self.kube_interface.set_label(
-            KubernetesResourceType.SERVICEACCOUNT,
-            service_account.name,
-            f"{PRIMARY_LABELNAME}=True",
-            service_account.namespace,
-        )
-        self.kube_interface.set_label(
-            KubernetesResourceType.ROLEBINDING,
-            f"{service_account.name}-role-binding",
-            f"{PRIMARY_LABELNAME}=True",
-            service_account.namespace,
+        # Relabeling primary
+        primary_account = self.get_primary(namespace)
+
+        if primary_account is not None and primary_account.id == account_id:
+            return account_id
+
+        run_concurrently(
+            *self._primary_label_patches(
+                metadata["name"],
+                metadata["namespace"],
+                add={PRIMARY_LABELNAME: "True"},
+            ),
+            *(
+                self._primary_label_patches(
+                    primary_account.name,
+                    primary_account.namespace,
+                    remove=[PRIMARY_LABELNAME],
+                )
+                if primary_account is not None
+                else ()
+            ),
         )
 
         return account_id
 
+    def _primary_label_patches(
+        self,
+        name: str,
+        namespace: str,
+        add: Optional[Mapping[str, str]] = None,
+        remove: Optional[Iterable[str]] = None,
+    ) -> List[Callable[[], None]]:
+        """Return the label patches of the resources flagging a service account as primary."""
+        return [
+            partial(
+                self.kube_interface.patch_labels,
+                resource_type,
+                resource_name,
+                add=add,
+                remove=remove,
+                namespace=namespace,
+            )
+            for resource_type, resource_name in (
+                (KubernetesResourceType.SERVICEACCOUNT, name),
+                (KubernetesResourceType.ROLEBINDING, f"{name}-role-binding"),
+            )
+        ]
+
     def create(self, service_account: ServiceAccount) -> str:
         """Create a new service account and return ids associated id.
 
@@ -1090,85 +2348,28 @@ class K8sServiceAccountRegistry(AbstractServiceAccountRegistry):
         rolename = username + "-role"
         rolebindingname = username + "-role-binding"
 
-        # Check if the resources to be created already exist in K8s cluster
-        if self.kube_interface.exists(
-            KubernetesResourceType.SERVICEACCOUNT,
-            username,
-            namespace=service_account.namespace,
-        ):
-            raise ResourceAlreadyExists(
-                "Could not create the service account. "
-                f"A {KubernetesResourceType.SERVICEACCOUNT} with name '{username}' already exists."
-            )
-
-        if self.kube_interface.exists(
-            KubernetesResourceType.ROLE,
-            rolename,
-            namespace=service_account.namespace,
-        ):
-            raise ResourceAlreadyExists(
-                "Could not create the service account. "
-                f"A {KubernetesResourceType.ROLE} with name '{rolename}' already exists."
-            )
+        namespace = service_account.namespace
+        resources = [
+            (KubernetesResourceType.SERVICEACCOUNT, username),
+            (KubernetesResourceType.ROLE, rolename),
+            (KubernetesResourceType.ROLEBINDING, rolebindingname),
+        ]
 
-        if self.kube_interface.exists(
-            KubernetesResourceType.ROLEBINDING,
-            rolebindingname,
-            namespace=service_account.namespace,
-        ):
-            raise ResourceAlreadyExists(
-                "Could not create the service account. "
-                f"A {KubernetesResourceType.ROLEBINDING} with name '{rolebindingname}' already exists."
+        # Check if the resources to be created already exist in K8s cluster
+        existing = run_concurrently(
+            *(
+                partial(self.kube_interface.exists, resource_type, name, namespace)
+                for resource_type, name in resources
             )
-
-        self.kube_interface.create(
-            KubernetesResourceType.SERVICEACCOUNT,
-            username,
-            namespace=service_account.namespace,
-            **{"username": username},
-        )
-        self.kube_interface.create(
-            KubernetesResourceType.ROLE,
-            rolename,
-            namespace=service_account.namespace,
-            **{
-                "resource": [
-                    "pods",
-                    "configmaps",
-                    "services",
-                    "serviceaccounts",
-                    "secrets",
-                ],
-                "verb": ["create", "get", "list", "watch", "delete"],
-            },
-        )
-        self.kube_interface.create(
-            KubernetesResourceType.ROLEBINDING,
-            rolebindingname,
-            namespace=service_account.namespace,
-            role=rolename,
-            serviceaccount=serviceaccount,
-            username=username,
         )
+        for (resource_type, name), exists in zip(resources, existing):
+            if exists:
+                raise ResourceAlreadyExists(
+                    "Could not create the service account. "
+                    f"A {resource_type} with name '{name}' already exists."
+                )
 
-        self.kube_interface.set_label(
-            KubernetesResourceType.SERVICEACCOUNT,
-            service_account.name,
-            f"{MANAGED_BY_LABELNAME}={SPARK8S_LABEL}",
-            namespace=service_account.namespace,
-        )
-        self.kube_interface.set_label(
-            KubernetesResourceType.ROLE,
-            rolename,
-            f"{MANAGED_BY_LABELNAME}={SPARK8S_LABEL}",
-            namespace=service_account.namespace,
-        )
-        self.kube_interface.set_label(
-            KubernetesResourceType.ROLEBINDING,
-            rolebindingname,
-            f"{MANAGED_BY_LABELNAME}={SPARK8S_LABEL}",
-            namespace=service_account.namespace,
-        )
+        self.kube_interface.apply_manifest(self._account_manifests(username, namespace))
 
         if service_account.primary is True:
             self.set_primary(serviceaccount, service_account.namespace)
@@ -1178,40 +2379,54 @@ class K8sServiceAccountRegistry(AbstractServiceAccountRegistry):
 
         return serviceaccount
 
-    def _create_account_configuration(self, service_account: ServiceAccount):
-        secret_name = self._get_secret_name(service_account.name)
+    def _account_manifests(self, username: str, namespace: str) -> List[Dict[str, Any]]:
+        """Return the manifests of the service account, role and role binding of a Spark user.
 
-        try:
-            self.kube_interface.delete(
-                KubernetesResourceType.SECRET,
-                secret_name,
-                namespace=service_account.namespace,
-            )
-        except Exception:
-            pass
+        Manifests are rendered from the same templates used when creating each resource.
 
-        with umask_named_temporary_file(
-            mode="w", prefix="spark-dynamic-conf-k8s-", suffix=".conf"
-        ) as t:
-            self.logger.debug(
-                f"Spark dynamic props available for reference at {t.name}\n"
+        Args:
+            username: name of the service account
+            namespace: namespace of the service account
+        """
+        return [
+            _render_template(
+                self.kube_interface.defaults,
+                resource_type,
+                resource_name,
+                namespace,
+                username=username,
+            ).to_dict()
+            for resource_type, resource_name in (
+                (KubernetesResourceType.SERVICEACCOUNT, username),
+                (KubernetesResourceType.ROLE, username + "-role"),
+                (KubernetesResourceType.ROLEBINDING, username + "-role-binding"),
             )
+        ]
 
-            PropertyFile(
-                {
-                    self._kubernetes_key_serializer.serialize(key): value
-                    for key, value in service_account.extra_confs.props.items()
-                }
-            ).write(t.file)
+    def _create_account_configuration(self, service_account: ServiceAccount):
+        secret_name = self._get_secret_name(service_account.name)
 
-            t.flush()
+        self.kube_interface.delete_many(
+            [(KubernetesResourceType.SECRET, secret_name)],
+            namespace=service_account.namespace,
+        )
 
-            self.kube_interface.create(
-                KubernetesResourceType.SECRET_GENERIC,
-                secret_name,
-                namespace=service_account.namespace,
-                **{"from-env-file": str(t.name)},
-            )
+        self.logger.debug(f"Storing Spark dynamic props in secret {secret_name}")
+
+        # values are stripped, as they used to be when written to an env file
+        self.kube_interface.create_secret(
+            secret_name,
+            {
+                key: base64.b64encode(str(value).strip().encode("utf-8")).decode(
+                    "ascii"
+                )
+                for key, value in self._kubernetes_key_serializer.serialize_keys(
+                    service_account.extra_confs.props
+                ).items()
+            },
+            namespace=service_account.namespace,
+            labels={MANAGED_BY_LABELNAME: SPARK8S_LABEL},
+        )
 
     def set_configurations(self, account_id: str, configurations: PropertyFile) -> str:
         """Set a new service account configuration for the provided service account id.
@@ -1252,30 +2467,13 @@ class K8sServiceAccountRegistry(AbstractServiceAccountRegistry):
             raise AccountNotFound(name)
 
         try:
-            self.kube_interface.delete(
-                KubernetesResourceType.SERVICEACCOUNT, name, namespace=namespace
-            )
-        except Exception as e:
-            self.logger.debug(e)
-
-        try:
-            self.kube_interface.delete(
-                KubernetesResourceType.ROLE, rolename, namespace=namespace
-            )
-        except Exception as e:
-            self.logger.debug(e)
-
-        try:
-            self.kube_interface.delete(
-                KubernetesResourceType.ROLEBINDING, rolebindingname, namespace=namespace
-            )
-        except Exception as e:
-            self.logger.debug(e)
-
-        try:
-            self.kube_interface.delete(
-                KubernetesResourceType.SECRET,
-                self._get_secret_name(name),
+            self.kube_interface.delete_many(
+                [
+                    (KubernetesResourceType.SERVICEACCOUNT, name),
+                    (KubernetesResourceType.ROLE, rolename),
+                    (KubernetesResourceType.ROLEBINDING, rolebindingname),
+                    (KubernetesResourceType.SECRET, self._get_secret_name(name)),
+                ],
                 namespace=namespace,
             )
         except Exception as e:
@@ -1284,6 +2482,13 @@ class K8sServiceAccountRegistry(AbstractServiceAccountRegistry):
         return account_id
 
     def get(self, account_id: str) -> Optional[ServiceAccount]:
+        metadata = self._get_metadata(account_id)
+        if metadata is None:
+            return None
+        return self._build_service_account_from_raw(metadata)
+
+    def _get_metadata(self, account_id: str) -> Optional[Dict[str, Any]]:
+        """Return the metadata of the service account with the provided id, None if it does not exist."""
         namespace, username = account_id.split(":")
         try:
             service_account_raw = self.kube_interface.get_service_account(
@@ -1291,7 +2496,7 @@ class K8sServiceAccountRegistry(AbstractServiceAccountRegistry):
             )
         except K8sResourceNotFound:
             return None
-        return self._build_service_account_from_raw(service_account_raw["metadata"])
+        return service_account_raw["metadata"]
 
 
 class InMemoryAccountRegistry(AbstractServiceAccountRegistry):
@@ -1379,7 +2584,9 @@ class InMemoryAccountRegistry(AbstractServiceAccountRegistry):
         if account_id not in self.cache.keys():
             raise AccountNotFound(account_id)
 
-        self.cache[account_id].extra_confs = configurations
+        self.cache[account_id] = replace(
+            self.cache[account_id], extra_confs=configurations
+        )
         return account_id
 
     def get(self, account_id: str) -> Optional[ServiceAccount]:
@@ -1,23 +1,31 @@
 """Module for general logging functionalities and abstractions."""
+import atexit
 import errno
 import io
 import json
 import logging
 import os
+import re
+import string
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from contextlib import contextmanager
 from copy import deepcopy as copy
-from functools import reduce
+from functools import lru_cache, reduce
 from logging import Logger, config, getLogger
-from tempfile import NamedTemporaryFile
+from tempfile import NamedTemporaryFile, TemporaryFile
 from typing import (
+    IO,
     Any,
     Callable,
     Dict,
+    Iterator,
     List,
     Literal,
     Mapping,
     Optional,
+    Pattern,
     TypedDict,
     TypeVar,
     Union,
@@ -27,8 +35,15 @@ from urllib.parse import quote, unquote
 import yaml
 from envyaml import EnvYAML
 
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:  # libyaml bindings not available
+    from yaml import SafeLoader as YamlSafeLoader  # type: ignore
+
 PathLike = Union[str, "os.PathLike[str]"]
 
+Command = Union[str, List[str]]
+
 LevelTypes = Literal[
     "CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG", "NOTSET", 50, 40, 30, 20, 10, 0
 ]
@@ -243,12 +258,15 @@ def create_dir_if_not_exists(directory: PathLike) -> PathLike:
     return directory
 
 
-def parse_yaml_shell_output(cmd: str) -> Union[Dict[str, Any], str]:
+def parse_yaml_shell_output(
+    cmd: Command, input: Optional[str] = None
+) -> Union[Dict[str, Any], str]:
     """
     Execute command and parse output as YAML.
 
     Args:
-        cmd: string with bash command
+        cmd: string with bash command, or list of arguments to be executed without a shell
+        input: text to be written to the standard input of the command
 
     Raises:
         CalledProcessError: when the bash command fails and exits with code other than 0
@@ -257,17 +275,150 @@ def parse_yaml_shell_output(cmd: str) -> Union[Dict[str, Any], str]:
         dictionary representing the output of the command
     """
     with io.StringIO() as buffer:
-        buffer.write(execute_command_output(cmd))
+        buffer.write(execute_command_output(cmd, input))
         buffer.seek(0)
-        return yaml.safe_load(buffer)
+        return yaml.load(buffer, Loader=YamlSafeLoader)
+
+
+def parse_json_shell_output(
+    cmd: Command, input: Optional[str] = None
+) -> Optional[Union[Dict[str, Any], List[Any]]]:
+    """
+    Execute command and parse output as JSON.
+
+    Args:
+        cmd: string with bash command, or list of arguments to be executed without a shell
+        input: text to be written to the standard input of the command
+
+    Raises:
+        CalledProcessError: when the bash command fails and exits with code other than 0
+
+    Returns:
+        dictionary representing the output of the command, None if the command has no output
+    """
+    output = subprocess.check_output(
+        cmd,
+        shell=isinstance(cmd, str),
+        stderr=subprocess.STDOUT,
+        **_input_kwargs(input),
+    )
+    return json.loads(output) if output.strip() else None
+
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_ITEM_SEPARATOR = re.compile(r"[\s,]*")
+
+
+@lru_cache(maxsize=None)
+def _json_list_start(key: str) -> Pattern[str]:
+    return re.compile(rf'"{re.escape(key)}"\s*:\s*\[')
+
+
+def iter_json_items(
+    stream: IO[bytes], key: str = "items", chunk_size: int = 2**16
+) -> Iterator[Any]:
+    """
+    Lazily decode the entries of a top-level JSON list from a binary stream.
+
+    Only the entry being decoded (plus one chunk) is held in memory at a time.
+
+    Args:
+        stream: binary stream containing a JSON object
+        key: name of the top-level field holding the list
+        chunk_size: number of characters read from the stream at a time
+
+    Raises:
+        JSONDecodeError: when the stream ends within a malformed or truncated entry
+
+    Returns:
+        iterator over the decoded entries
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8")
+    start = _json_list_start(key)
+
+    buffer = ""
+    while (match := start.search(buffer)) is None:
+        chunk = text.read(chunk_size)
+        if not chunk:
+            return
+        buffer += chunk
+
+    pos = match.end()
+    while True:
+        pos = _JSON_ITEM_SEPARATOR.match(buffer, pos).end()
+        if buffer.startswith("]", pos):
+            return
+        try:
+            item, pos = _JSON_DECODER.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            chunk = text.read(chunk_size)
+            if not chunk:
+                raise
+            buffer, pos = buffer[pos:] + chunk, 0
+            continue
+        yield item
+
+
+@contextmanager
+def execute_command_stream(cmd: Command) -> Iterator[IO[bytes]]:
+    """
+    Execute command and provide its standard output as a binary stream.
+
+    Standard error is spooled to a temporary file so that the command cannot block on a full pipe.
+
+    Args:
+        cmd: string with bash command, or list of arguments to be executed without a shell
+
+    Raises:
+        CalledProcessError: when the bash command fails and exits with code other than 0
+
+    Returns:
+        context manager providing the standard output stream of the command
+    """
+    with TemporaryFile() as stderr:
+        process = subprocess.Popen(
+            cmd, shell=isinstance(cmd, str), stdout=subprocess.PIPE, stderr=stderr
+        )
+        try:
+            yield process.stdout
+        finally:
+            process.stdout.close()
+            returncode = process.wait()
+
+        if returncode != 0:
+            stderr.seek(0)
+            raise subprocess.CalledProcessError(returncode, cmd, output=stderr.read())
 
 
-def execute_command_output(cmd: str) -> str:
+def stream_json_shell_items(cmd: Command, key: str = "items") -> Iterator[Any]:
+    """
+    Execute command and lazily parse the entries of the list contained in its JSON output.
+
+    Args:
+        cmd: string with bash command, or list of arguments to be executed without a shell
+        key: name of the top-level field holding the list
+
+    Raises:
+        CalledProcessError: when the bash command fails and exits with code other than 0
+
+    Returns:
+        iterator over the decoded entries
+    """
+    with execute_command_stream(cmd) as stdout:
+        yield from iter_json_items(stdout, key)
+
+
+def _input_kwargs(input: Optional[str]) -> Dict[str, bytes]:
+    return {} if input is None else {"input": input.encode("utf-8")}
+
+
+def execute_command_output(cmd: Command, input: Optional[str] = None) -> str:
     """
     Execute command and return the output.
 
     Args:
-        cmd: string with bash command
+        cmd: string with bash command, or list of arguments to be executed without a shell
+        input: text to be written to the standard input of the command
 
     Raises:
         CalledProcessError: when the bash command fails and exits with code other than 0
@@ -277,7 +428,10 @@ def execute_command_output(cmd: str) -> str:
     """
     try:
         output = subprocess.check_output(
-            cmd, shell=True, stderr=subprocess.STDOUT
+            cmd,
+            shell=isinstance(cmd, str),
+            stderr=subprocess.STDOUT,
+            **_input_kwargs(input),
         ).decode("utf-8")
     except subprocess.CalledProcessError as e:
         raise e
@@ -285,6 +439,57 @@ def execute_command_output(cmd: str) -> str:
     return output
 
 
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+EXECUTOR_MAX_WORKERS = 8
+EXECUTOR_THREAD_NAME_PREFIX = "spark8t-k8s"
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Return the process-wide thread pool used to run independent Kubernetes calls concurrently.
+
+    The pool is created on first use, reused by every interface and registry, and shut down when
+    the interpreter exits.
+
+    Returns:
+        shared ThreadPoolExecutor
+    """
+    global _executor
+
+    # the pool is never replaced once created, hence it can be read without locking
+    if _executor is not None:
+        return _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=EXECUTOR_MAX_WORKERS,
+                thread_name_prefix=EXECUTOR_THREAD_NAME_PREFIX,
+            )
+            atexit.register(_executor.shutdown)
+        return _executor
+
+
+def run_concurrently(*calls: Callable[[], T]) -> List[T]:
+    """
+    Run independent calls on the shared thread pool and wait for all of them to complete.
+
+    Calls must not wait on other tasks of the pool themselves, to avoid exhausting its workers.
+
+    Args:
+        calls: callables taking no arguments
+
+    Returns:
+        results of the calls, in the given order. If any call failed, the exception of the first
+        failed call in that order is raised once all calls completed.
+    """
+    futures = [get_executor().submit(call) for call in calls]
+    wait(futures)
+    return [future.result() for future in futures]
+
+
 @contextmanager
 def environ(*remove, **update):
     """
@@ -331,14 +536,18 @@ class PercentEncodingSerializer:
 
     _SPECIAL = "§"
 
+    # characters never escaped by quote, with the default safe "/"
+    _QUOTE_SAFE = frozenset(string.ascii_letters + string.digits + "_.-~/")
+
     def __init__(self, percent_char: str = "_"):
         self.percent_char = percent_char
-
-    @property
-    def _double_percent_char(self) -> str:
-        return "".join([self.percent_char] * 2)
+        self._double_percent_char = percent_char * 2
+        self._plain_chars = self._QUOTE_SAFE - {percent_char}
 
     def serialize(self, input_string: str) -> str:
+        # strings made only of characters that are left untouched need no escaping
+        if self._plain_chars.issuperset(input_string):
+            return input_string
         return (
             quote(input_string)
             .replace(self.percent_char, self._double_percent_char)
@@ -346,8 +555,20 @@ class PercentEncodingSerializer:
         )
 
     def deserialize(self, input_string: str) -> str:
+        if self.percent_char not in input_string and "%" not in input_string:
+            return input_string
         return unquote(
             input_string.replace(self._double_percent_char, self._SPECIAL)
             .replace(self.percent_char, "%")
             .replace(self._SPECIAL, self.percent_char)
         )
+
+    def serialize_keys(self, mapping: Mapping[str, T]) -> Dict[str, T]:
+        """Return a copy of the mapping with serialized keys."""
+        serialize = self.serialize
+        return {serialize(key): value for key, value in mapping.items()}
+
+    def deserialize_keys(self, mapping: Mapping[str, T]) -> Dict[str, T]:
+        """Return a copy of the mapping with de-serialized keys."""
+        deserialize = self.deserialize
+        return {deserialize(key): value for key, value in mapping.items()}
@@ -1,11 +1,14 @@
+import io
 import json
 import subprocess
+import traceback
 import uuid
-from collections import defaultdict
-from subprocess import CalledProcessError
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
 
 import pytest
 
+from spark8t.cli.service_account_registry import run
 from spark8t.literals import MANAGED_BY_LABELNAME, PRIMARY_LABELNAME, SPARK8S_LABEL
 
 VALID_BACKENDS = [
@@ -32,18 +35,22 @@ def namespace():
 
 
 def run_service_account_registry(*args):
-    """Run service_account_registry CLI command with given set of args
+    """Run service_account_registry CLI command in-process with given set of args
 
     Returns:
         Tuple: A tuple with the content of stdout, stderr and the return code
             obtained when the command is run.
     """
-    command = ["python3", "-m", "spark8t.cli.service_account_registry", *args]
-    try:
-        output = subprocess.run(command, check=True, capture_output=True)
-        return output.stdout.decode(), output.stderr.decode(), output.returncode
-    except CalledProcessError as e:
-        return e.stdout.decode(), e.stderr.decode(), e.returncode
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            return_code = run(list(args))
+        except SystemExit as e:
+            return_code = e.code
+        except Exception:
+            traceback.print_exc()
+            return_code = 1
+    return stdout.getvalue(), stderr.getvalue(), return_code
 
 
 def parameterize(permissions):
@@ -70,18 +77,28 @@ def service_account(namespace, request):
 
 @pytest.fixture
 def multiple_namespaces_and_service_accounts():
-    result = defaultdict(list)
-    for _ in range(3):
-        namespace_name = str(uuid.uuid4())
+    result = {
+        str(uuid.uuid4()): [str(uuid.uuid4()) for _ in range(3)] for _ in range(3)
+    }
+    for namespace_name in result.keys():
         create_ns_command = ["kubectl", "create", "namespace", namespace_name]
         subprocess.run(create_ns_command, check=True)
 
-        for _ in range(3):
-            sa_name = str(uuid.uuid4())
-            run_service_account_registry(
-                "create", "--username", sa_name, "--namespace", namespace_name
+    # The CLI does not print anything on creation, hence the accounts can be
+    # created concurrently without redirecting (process-wide) stdout/stderr.
+    with ThreadPoolExecutor(max_workers=9) as executor:
+        list(
+            executor.map(
+                lambda ns_and_sa: run(
+                    ["create", "--username", ns_and_sa[1], "--namespace", ns_and_sa[0]]
+                ),
+                [
+                    (namespace_name, sa_name)
+                    for namespace_name, sa_names in result.items()
+                    for sa_name in sa_names
+                ],
             )
-            result[namespace_name].append(sa_name)
+        )
 
     yield result
 
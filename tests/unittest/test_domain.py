@@ -2,10 +2,11 @@ import logging
 import os
 import tempfile
 import uuid
+from dataclasses import replace
 
 import pytest
 
-from spark8t.domain import Defaults, PropertyFile, ServiceAccount
+from spark8t.domain import Defaults, LazyPropertyFile, PropertyFile, ServiceAccount
 from spark8t.services import InMemoryAccountRegistry
 from spark8t.utils import umask_named_temporary_file
 
@@ -57,6 +58,21 @@ def test_defaults_kube_config():
         assert d.kube_config == "my-kube-config"
 
 
+def test_defaults_default_environ():
+    """
+    Validates that defaults read the process environment when none is given.
+    """
+
+    from spark8t.utils import environ
+
+    d = Defaults()
+
+    assert d.environ is os.environ
+
+    with environ(KUBECONFIG="my-kube-config"):
+        assert d.kube_config == "my-kube-config"
+
+
 def test_service_account():
     """
     Validates service account including defending namespace and account name against overrides.
@@ -93,6 +109,61 @@ def test_service_account():
     assert sa.configurations.props.get("spark.dummy.property2") == spark_dummy_property2
 
 
+def test_service_account_configurations_cache():
+    """
+    Validates that service account configurations are cached and follow replaced values.
+    """
+    sa = ServiceAccount(name="spark", namespace="ns", api_server="k8s://api")
+
+    assert sa.configurations is sa.configurations
+
+    sa = replace(sa, extra_confs=PropertyFile({"spark.dummy.property": "value"}))
+    assert sa.configurations.props.get("spark.dummy.property") == "value"
+
+    sa = replace(sa, namespace="other-ns")
+    assert sa.configurations.props.get("spark.kubernetes.namespace") == "other-ns"
+    assert sa.configurations.props.get("spark.dummy.property") == "value"
+    assert sa.id == "other-ns:spark"
+
+
+def test_service_account_default_extra_confs():
+    """
+    Validates that service accounts do not share their default extra configurations.
+    """
+    sa1 = ServiceAccount(name="spark1", namespace="ns", api_server="k8s://api")
+    sa2 = ServiceAccount(name="spark2", namespace="ns", api_server="k8s://api")
+
+    assert sa1.extra_confs is not sa2.extra_confs
+
+    sa1.extra_confs.props["spark.dummy.property"] = "value"
+    assert len(sa2.extra_confs) == 0
+    assert sa2.configurations.props == {
+        "spark.kubernetes.authenticate.driver.serviceAccountName": "spark2",
+        "spark.kubernetes.namespace": "ns",
+    }
+
+
+def test_lazy_property_file():
+    """
+    Validates that lazy property files load their properties once, on first access.
+    """
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return {"spark.dummy.property": "value"}
+
+    prop = LazyPropertyFile(loader)
+    assert calls == []
+
+    assert len(prop) == 1
+    assert (prop + PropertyFile({"key": "value"})).props == {
+        "spark.dummy.property": "value",
+        "key": "value",
+    }
+    assert calls == [1]
+
+
 def test_property_removing_conf():
     """
     Validates removal of configuration options.
@@ -180,6 +251,16 @@ def test_property_file_parsing_from_confs():
     assert prop.props == {"key1": "value1", "key2": "value2"}
 
 
+def test_property_file_try_parse_line():
+    """
+    Validates that unparsable lines are skipped when parsing a single line.
+    """
+    assert PropertyFile.try_parse_line("key1=value1=x") == ("key1", "value1=x")
+    assert PropertyFile.try_parse_line("") is None
+    assert PropertyFile.try_parse_line(" #key1=value1") is None
+    assert PropertyFile.try_parse_line("key1") is None
+
+
 def test_property_file_parse_options():
     """
     Validates parsing of properties and options in PropertyFile abstraction.
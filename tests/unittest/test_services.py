@@ -1,12 +1,16 @@
 import base64
 import io
+import json
 import os
 import subprocess
+import threading
 import uuid
-from unittest.mock import patch
+from unittest.mock import PropertyMock, patch
 
+import httpx
 import pytest
 import yaml
+from lightkube.core.exceptions import ApiError
 from lightkube.resources.core_v1 import Secret
 from lightkube.resources.core_v1 import ServiceAccount as LightKubeServiceAccount
 from lightkube.resources.rbac_authorization_v1 import Role, RoleBinding
@@ -15,11 +19,14 @@ from OpenSSL import crypto
 
 from spark8t.cli import defaults
 from spark8t.domain import KubernetesResourceType, PropertyFile, ServiceAccount
+from spark8t.exceptions import AccountNotFound, K8sResourceNotFound
 from spark8t.literals import MANAGED_BY_LABELNAME, PRIMARY_LABELNAME, SPARK8S_LABEL
 from spark8t.services import (
     K8sServiceAccountRegistry,
+    KubectlProxy,
     KubeInterface,
     LightKube,
+    _ResourceCache,
     parse_conf_overrides,
 )
 
@@ -299,6 +306,54 @@ def test_lightkube(tmp_kubeconf):
     assert current_cluster.server == "https://0.0.0.1:9090"
 
 
+def test_kube_config_reloaded_on_file_change(tmp_kubeconf):
+    k = LightKube(kube_config_file=tmp_kubeconf, defaults=defaults)
+
+    config = k.kube_config
+    assert k.kube_config is config
+    assert k.context_name == "context2"
+
+    with open(tmp_kubeconf) as fid:
+        kubeconfig_yaml = yaml.safe_load(fid)
+    kubeconfig_yaml["current-context"] = "context3"
+    with open(tmp_kubeconf, "w") as fid:
+        yaml.dump(kubeconfig_yaml, fid)
+
+    stat = os.stat(tmp_kubeconf)
+    os.utime(tmp_kubeconf, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert k.kube_config is not config
+    assert k.context_name == "context3"
+    assert k.api_server == "https://0.0.0.2:8080"
+
+
+def test_select_by_master(tmp_kubeconf):
+    k = LightKube(kube_config_file=tmp_kubeconf, defaults=defaults)
+
+    assert k.select_by_master("https://0.0.0.1:9090") is k
+    assert k.select_by_master("https://0.0.0.2:8080").context_name == "context3"
+
+    with pytest.raises(AccountNotFound):
+        k.select_by_master("https://0.0.0.3:8080")
+
+
+def test_kube_config_shared_across_contexts(tmp_kubeconf):
+    k = LightKube(kube_config_file=tmp_kubeconf, defaults=defaults)
+    other = k.with_context("context2")
+
+    assert other.context_name == "context2"
+    assert other.kube_config is k.kube_config
+    assert other._cache is k._cache
+
+
+def test_lightkube_client_shared_across_interfaces(tmp_kubeconf):
+    k = LightKube(kube_config_file=tmp_kubeconf, defaults=defaults)
+
+    assert k.client is k.with_context("context2").client
+    assert k.client is LightKube(tmp_kubeconf, defaults=defaults).client
+    assert k.client is not k.with_context("context3").client
+
+
 def test_lightkube_get_secret(mocker, tmp_kubeconf):
     mock_lightkube_client_get = mocker.patch("lightkube.Client.get")
     kubeconfig = tmp_kubeconf
@@ -326,12 +381,334 @@ def test_lightkube_get_secret(mocker, tmp_kubeconf):
     assert conf_value == secret_result["data"][conf_key]
 
 
+def test_lightkube_get_missing_secret(mocker, tmp_kubeconf):
+    mock_lightkube_client_get = mocker.patch("lightkube.Client.get")
+    mock_lightkube_client_get.side_effect = ApiError(
+        response=httpx.Response(
+            404,
+            json={"kind": "Status", "code": 404, "message": "not found"},
+            request=httpx.Request("GET", "https://0.0.0.0"),
+        )
+    )
+
+    k = LightKube(kube_config_file=tmp_kubeconf, defaults=defaults)
+    assert k.get_secret(str(uuid.uuid4()), str(uuid.uuid4())) is None
+
+
+def test_kube_interface_get_missing_secret(mocker, tmp_kubeconf):
+    mock_subprocess = mocker.patch("subprocess.check_output")
+    mock_subprocess.return_value = b""
+
+    k = KubeInterface(tmp_kubeconf, defaults=defaults, context_name="context1")
+    assert k.get_secret(str(uuid.uuid4()), str(uuid.uuid4())) is None
+
+
+def test_resource_cache_is_bounded():
+    cache = _ResourceCache(maxsize=2)
+
+    cache.set(("ctx", "secret", "a", "ns"), "a", expiry=10.0, now=0.0)
+    cache.set(("ctx", "secret", "b", "ns"), "b", expiry=10.0, now=0.0)
+    cache.set(("ctx", "secret", "c", "ns"), "c", expiry=10.0, now=0.0)
+
+    assert len(cache) == 2
+    assert cache.get(("ctx", "secret", "a", "ns"), now=1.0) is None
+    assert cache.get(("ctx", "secret", "c", "ns"), now=1.0) == (10.0, "c")
+
+
+def test_resource_cache_evicts_expired_entries():
+    cache = _ResourceCache()
+
+    cache.set(("ctx", "secret", "a", "ns"), "a", expiry=1.0, now=0.0)
+    cache.set(("ctx", "secret", "b", "ns"), "b", expiry=3.0, now=2.0)
+
+    assert len(cache) == 1
+    assert cache.get(("ctx", "secret", "b", "ns"), now=4.0) is None
+    assert len(cache) == 0
+
+    cache.set(("ctx", "secret", "c", "ns"), None, expiry=6.0, now=5.0)
+    assert cache.get(("ctx", "secret", "c", "ns"), now=5.0) == (6.0, None)
+
+    cache.discard("secret", "c")
+    assert len(cache) == 0
+
+
+def test_lightkube_get_service_account_cached(mocker, tmp_kubeconf):
+    mock_lightkube_client_get = mocker.patch("lightkube.Client.get")
+    mocker.patch("lightkube.Client.patch")
+    resource_name = str(uuid.uuid4())
+    namespace = str(uuid.uuid4())
+
+    mock_lightkube_client_get.return_value = LightKubeServiceAccount.from_dict(
+        {
+            "apiVersion": "v1",
+            "kind": "ServiceAccount",
+            "metadata": {"name": resource_name, "namespace": namespace},
+        }
+    )
+
+    k = LightKube(kube_config_file=tmp_kubeconf, defaults=defaults, cache_ttl=2.0)
+    k.get_service_account(resource_name, namespace)["metadata"]["labels"] = {"k": "v"}
+    assert "labels" not in k.get_service_account(resource_name, namespace)["metadata"]
+    assert mock_lightkube_client_get.call_count == 1
+
+    k.set_label(KubernetesResourceType.SERVICEACCOUNT, resource_name, "k=v", namespace)
+    k.get_service_account(resource_name, namespace)
+    assert mock_lightkube_client_get.call_count == 2
+
+    k_no_cache = LightKube(kube_config_file=tmp_kubeconf, defaults=defaults)
+    k_no_cache.get_service_account(resource_name, namespace)
+    k_no_cache.get_service_account(resource_name, namespace)
+    assert mock_lightkube_client_get.call_count == 4
+
+
+def test_kube_interface_lightkube_read_backend(mocker, tmp_kubeconf):
+    mock_subprocess = mocker.patch("subprocess.check_output")
+    mock_lightkube_client_get = mocker.patch("lightkube.Client.get")
+    mock_lightkube_client_list = mocker.patch("lightkube.Client.list")
+    resource_name = str(uuid.uuid4())
+    namespace = str(uuid.uuid4())
+
+    mock_lightkube_client_get.return_value = LightKubeServiceAccount.from_dict(
+        {
+            "apiVersion": "v1",
+            "kind": "ServiceAccount",
+            "metadata": {"name": resource_name, "namespace": namespace},
+        }
+    )
+    mock_lightkube_client_list.return_value = iter(
+        [mock_lightkube_client_get.return_value]
+    )
+
+    k = KubeInterface(
+        kube_config_file=tmp_kubeconf, defaults=defaults, read_backend="lightkube"
+    )
+    sa = k.get_service_account(resource_name, namespace)
+
+    assert sa["metadata"]["name"] == resource_name
+    assert k.exists(KubernetesResourceType.SERVICEACCOUNT, resource_name, namespace)
+    assert mock_lightkube_client_get.call_count == 1
+    mock_lightkube_client_list.assert_called_once_with(
+        LightKubeServiceAccount,
+        namespace=namespace,
+        fields={"metadata.name": resource_name},
+        chunk_size=1,
+    )
+    mock_subprocess.assert_not_called()
+
+    with pytest.raises(ValueError):
+        KubeInterface(tmp_kubeconf, defaults=defaults, read_backend="unknown")
+
+
+def test_kube_interface_proxy_read_backend(mocker, tmp_kubeconf):
+    mock_subprocess = mocker.patch("subprocess.check_output")
+    mock_popen = mocker.patch("subprocess.Popen")
+    mock_http_get = mocker.patch("httpx.Client.get")
+    resource_name = str(uuid.uuid4())
+    namespace = str(uuid.uuid4())
+    context = str(uuid.uuid4())
+
+    mock_popen.return_value.poll.return_value = None
+    mock_popen.return_value.stdout.readline.return_value = (
+        "Starting to serve on 127.0.0.1:42157\n"
+    )
+
+    service_account = {
+        "apiVersion": "v1",
+        "kind": "ServiceAccount",
+        "metadata": {"name": resource_name, "namespace": namespace},
+    }
+
+    def side_effect(path):
+        request = httpx.Request("GET", f"http://127.0.0.1:42157{path}")
+        if resource_name in path:
+            return httpx.Response(200, json=service_account, request=request)
+        return httpx.Response(404, json={}, request=request)
+
+    mock_http_get.side_effect = side_effect
+
+    k = KubeInterface(
+        kube_config_file=tmp_kubeconf,
+        defaults=defaults,
+        context_name=context,
+        read_backend="proxy",
+    )
+
+    assert k.get_service_account(resource_name, namespace) == service_account
+    assert not k.exists(KubernetesResourceType.SERVICEACCOUNT, "missing", namespace)
+
+    with pytest.raises(K8sResourceNotFound):
+        k.get_service_account("missing", namespace)
+
+    mock_popen.assert_called_once_with(
+        [
+            defaults.kubectl_cmd,
+            "--kubeconfig",
+            tmp_kubeconf,
+            "--context",
+            context,
+            "proxy",
+            "--port=0",
+        ],
+        stdout=subprocess.PIPE,
+        stderr=mocker.ANY,
+        text=True,
+    )
+    mock_http_get.assert_any_call(
+        f"/api/v1/namespaces/{namespace}/serviceaccounts/{resource_name}"
+    )
+    mock_subprocess.assert_not_called()
+
+    k._proxy.close()
+
+
+def test_kubectl_proxy_startup_failure(mocker):
+    mock_popen = mocker.patch("subprocess.Popen")
+
+    def popen(cmd, stdout, stderr, text):
+        stderr.write(b"error: context not found\n")
+        return mock_popen.return_value
+
+    mock_popen.side_effect = popen
+    mock_popen.return_value.stdout.readline.return_value = ""
+
+    proxy = KubectlProxy(defaults.kubectl_cmd, context_name="missing")
+
+    with pytest.raises(RuntimeError, match="context not found"):
+        proxy._ensure_proxy()
+    mock_popen.return_value.kill.assert_called_once()
+
+
+def test_kubectl_proxy_startup_timeout(mocker):
+    mock_popen = mocker.patch("subprocess.Popen")
+    started = threading.Event()
+
+    def readline():
+        # blocks until the process is killed
+        started.wait(5)
+        return ""
+
+    mock_popen.return_value.stdout.readline.side_effect = readline
+    mock_popen.return_value.kill.side_effect = started.set
+
+    proxy = KubectlProxy(defaults.kubectl_cmd)
+    proxy._startup_timeout = 0.1
+
+    with pytest.raises(RuntimeError, match="not serving"):
+        proxy._ensure_proxy()
+    mock_popen.return_value.kill.assert_called_once()
+
+
+def test_kube_interface_proxy_writes(mocker, tmp_kubeconf):
+    mock_subprocess = mocker.patch("subprocess.check_output")
+    mock_popen = mocker.patch("subprocess.Popen")
+    mock_http_delete = mocker.patch("httpx.Client.delete")
+    mock_http_patch = mocker.patch("httpx.Client.patch")
+    resource_name = str(uuid.uuid4())
+    namespace = str(uuid.uuid4())
+    path = f"/api/v1/namespaces/{namespace}/serviceaccounts/{resource_name}"
+
+    mock_popen.return_value.poll.return_value = None
+    mock_popen.return_value.stdout.readline.return_value = (
+        "Starting to serve on 127.0.0.1:42158\n"
+    )
+
+    def response(method):
+        def side_effect(path, **kwargs):
+            request = httpx.Request(method, f"http://127.0.0.1:42158{path}")
+            return httpx.Response(200, json={}, request=request)
+
+        return side_effect
+
+    mock_http_delete.side_effect = response("DELETE")
+    mock_http_patch.side_effect = response("PATCH")
+
+    k = KubeInterface(
+        kube_config_file=tmp_kubeconf,
+        defaults=defaults,
+        context_name=str(uuid.uuid4()),
+        read_backend="proxy",
+    )
+
+    k.set_label("serviceaccount", resource_name, "key=value", namespace)
+    k.remove_label("serviceaccount", resource_name, "key", namespace)
+    k.delete("serviceaccount", resource_name, namespace)
+
+    merge_patch = {"Content-Type": "application/merge-patch+json"}
+    mock_http_patch.assert_any_call(
+        path,
+        content=json.dumps({"metadata": {"labels": {"key": "value"}}}),
+        headers=merge_patch,
+    )
+    mock_http_patch.assert_any_call(
+        path,
+        content=json.dumps({"metadata": {"labels": {"key": None}}}),
+        headers=merge_patch,
+    )
+    mock_http_delete.assert_called_once_with(path)
+    mock_subprocess.assert_not_called()
+
+
+def test_kube_interface_exec_namespace_flags(mocker, tmp_kubeconf):
+    mock_subprocess = mocker.patch("subprocess.check_output")
+    mock_subprocess.return_value = b""
+    namespace = str(uuid.uuid4())
+    context = "context1"
+    prefix = f"kubectl --kubeconfig {tmp_kubeconf}"
+
+    k = KubeInterface(tmp_kubeconf, defaults=defaults, context_name=context)
+
+    k.exec("get serviceaccount")
+    k.exec("get serviceaccount -A", namespace=namespace)
+    k.exec(f"get serviceaccount --namespace={namespace}", namespace="other")
+    k.exec("get serviceaccount --namespaces", namespace=namespace)
+    k.exec("get serviceaccount --context=context2", namespace=namespace)
+
+    for cmd in [
+        f"{prefix} --context {context} get serviceaccount -o json",
+        f"{prefix} --context {context} get serviceaccount -A -o json",
+        f"{prefix} --context {context} get serviceaccount --namespace={namespace} -o json",
+        f"{prefix} --namespace {namespace} --context {context} get serviceaccount --namespaces -o json",
+        f"{prefix} --namespace {namespace} get serviceaccount --context=context2 -o json",
+    ]:
+        mock_subprocess.assert_any_call(
+            cmd.split(), shell=False, stderr=subprocess.STDOUT
+        )
+
+
+def test_kube_interface_exists(mocker, tmp_kubeconf):
+    mock_subprocess = mocker.patch("subprocess.check_output")
+    resource_name = str(uuid.uuid4())
+    namespace = str(uuid.uuid4())
+    context = "context1"
+
+    def side_effect(*args, **kwargs):
+        return (
+            f"serviceaccount/{resource_name}\n".encode("utf-8")
+            if resource_name in args[0]
+            else b""
+        )
+
+    mock_subprocess.side_effect = side_effect
+
+    k = KubeInterface(tmp_kubeconf, defaults=defaults, context_name=context)
+
+    assert k.exists("serviceaccount", resource_name, namespace)
+    assert not k.exists("serviceaccount", "missing", namespace)
+
+    mock_subprocess.assert_any_call(
+        f"kubectl --kubeconfig {tmp_kubeconf} --namespace {namespace} --context {context} "
+        f"get serviceaccount {resource_name} --ignore-not-found -o name".split(),
+        shell=False,
+        stderr=subprocess.STDOUT,
+    )
+
+
 def test_kube_interface_get_secret(mocker, tmp_path):
     mock_subprocess = mocker.patch("subprocess.check_output")
 
     # mock logic
     def side_effect(*args, **kwargs):
-        return values[args[0]]
+        return values[" ".join(args[0])]
 
     mock_subprocess.side_effect = side_effect
 
@@ -344,7 +721,9 @@ def test_kube_interface_get_secret(mocker, tmp_path):
     token = str(uuid.uuid4())
     conf_key = str(uuid.uuid4())
     conf_value = str(uuid.uuid4())
-    conf_value_base64_encoded = base64.b64encode(conf_value.encode("utf-8"))
+    conf_value_base64_encoded = base64.b64encode(conf_value.encode("utf-8")).decode(
+        "utf-8"
+    )
 
     kubeconfig_yaml = {
         "apiVersion": "v1",
@@ -374,7 +753,7 @@ def test_kube_interface_get_secret(mocker, tmp_path):
     with open(kube_config_file, "w") as fid:
         yaml.dump(kubeconfig_yaml, fid, sort_keys=False)
 
-    cmd_get_secret = f"kubectl --kubeconfig {kube_config_file} --namespace {namespace} --context {context} get secret {secret_name} --ignore-not-found -o yaml"
+    cmd_get_secret = f"kubectl --kubeconfig {kube_config_file} --namespace {namespace} --context {context} get secret {secret_name} --ignore-not-found -o json"
     output_get_secret_yaml = {
         "apiVersion": "v1",
         "data": {conf_key: conf_value_base64_encoded},
@@ -388,9 +767,7 @@ def test_kube_interface_get_secret(mocker, tmp_path):
         },
         "type": "Opaque",
     }
-    output_get_secret = yaml.dump(output_get_secret_yaml, sort_keys=False).encode(
-        "utf-8"
-    )
+    output_get_secret = json.dumps(output_get_secret_yaml).encode("utf-8")
     values = {
         cmd_get_secret: output_get_secret,
     }
@@ -402,7 +779,7 @@ def test_kube_interface_get_secret(mocker, tmp_path):
     assert conf_value == secret_result["data"][conf_key]
 
     mock_subprocess.assert_any_call(
-        cmd_get_secret, shell=True, stderr=subprocess.STDOUT
+        cmd_get_secret.split(), shell=False, stderr=subprocess.STDOUT
     )
 
 
@@ -411,8 +788,8 @@ def test_lightkube_set_label_service_account(mocker, tmp_kubeconf):
     kubeconfig = tmp_kubeconf
     resource_name = str(uuid.uuid4())
     namespace = str(uuid.uuid4())
-    label_key = str(uuid.uuid4())
-    label_value = str(uuid.uuid4())
+    label_key = f"example.com/{uuid.uuid4()}"
+    label_value = f"{uuid.uuid4()}=1"
     label = f"{label_key}={label_value}"
 
     mock_lightkube_client_patch.return_value = 0
@@ -420,13 +797,49 @@ def test_lightkube_set_label_service_account(mocker, tmp_kubeconf):
     k = LightKube(kube_config_file=kubeconfig, defaults=defaults)
     k.set_label("serviceaccount", resource_name, label, namespace)
 
-    patch = {"metadata": {"labels": {label_key: label_value}}}
+    patch = [
+        {
+            "op": "add",
+            "path": f"/metadata/labels/{label_key.replace('/', '~1')}",
+            "value": label_value,
+        }
+    ]
 
     mock_lightkube_client_patch.assert_any_call(
         res=LightKubeServiceAccount,
         name=resource_name,
         namespace=namespace,
         obj=patch,
+        patch_type=PatchType.JSON,
+    )
+
+
+def test_lightkube_set_label_without_labels(mocker, tmp_kubeconf):
+    mock_lightkube_client_patch = mocker.patch("lightkube.Client.patch")
+    resource_name = str(uuid.uuid4())
+    namespace = str(uuid.uuid4())
+    label_key = str(uuid.uuid4())
+    label_value = str(uuid.uuid4())
+
+    missing_path = ApiError(
+        response=httpx.Response(
+            422,
+            json={"kind": "Status", "code": 422, "message": "missing path"},
+            request=httpx.Request("PATCH", "https://0.0.0.0"),
+        )
+    )
+    mock_lightkube_client_patch.side_effect = [missing_path, None]
+
+    k = LightKube(kube_config_file=tmp_kubeconf, defaults=defaults)
+    k.set_label(
+        "serviceaccount", resource_name, f"{label_key}={label_value}", namespace
+    )
+
+    mock_lightkube_client_patch.assert_called_with(
+        res=LightKubeServiceAccount,
+        name=resource_name,
+        namespace=namespace,
+        obj={"metadata": {"labels": {label_key: label_value}}},
     )
 
 
@@ -552,7 +965,7 @@ def test_kube_interface_set_label(mocker, tmp_path):
 
     # mock logic
     def side_effect(*args, **kwargs):
-        return values[args[0]]
+        return values[" ".join(args[0])]
 
     mock_subprocess.side_effect = side_effect
 
@@ -594,7 +1007,7 @@ def test_kube_interface_set_label(mocker, tmp_path):
     with open(kube_config_file, "w") as fid:
         yaml.dump(kubeconfig_yaml, fid, sort_keys=False)
 
-    cmd_set_label = f"kubectl --kubeconfig {kube_config_file} --namespace {namespace} --context {context} label {resource_type} {resource_name} {label} -o yaml"
+    cmd_set_label = f"kubectl --kubeconfig {kube_config_file} --namespace {namespace} --context {context} label {resource_type} {resource_name} {label} -o json"
 
     output_set_label = "0".encode("utf-8")
     values = {
@@ -606,7 +1019,9 @@ def test_kube_interface_set_label(mocker, tmp_path):
     k = KubeInterface(kube_config_file=kube_config_file, defaults=defaults)
     k.set_label(resource_type, resource_name, label, namespace)
 
-    mock_subprocess.assert_any_call(cmd_set_label, shell=True, stderr=subprocess.STDOUT)
+    mock_subprocess.assert_any_call(
+        cmd_set_label.split(), shell=False, stderr=subprocess.STDOUT
+    )
 
 
 def test_lightkube_create_service_account(mocker, tmp_kubeconf):
@@ -745,6 +1160,65 @@ def test_lightkube_create_rolebinding(mocker, tmp_kubeconf):
     )
 
 
+def test_lightkube_patch_labels(mocker, tmp_kubeconf):
+    mock_lightkube_client_patch = mocker.patch("lightkube.Client.patch")
+    resource_name = str(uuid.uuid4())
+    namespace = str(uuid.uuid4())
+
+    k = LightKube(kube_config_file=tmp_kubeconf, defaults=defaults)
+    k.patch_labels(
+        KubernetesResourceType.ROLEBINDING,
+        resource_name,
+        add={PRIMARY_LABELNAME: "True"},
+        remove=["key"],
+        namespace=namespace,
+    )
+
+    mock_lightkube_client_patch.assert_called_once_with(
+        res=RoleBinding,
+        name=resource_name,
+        namespace=namespace,
+        obj={"metadata": {"labels": {"key": None, PRIMARY_LABELNAME: "True"}}},
+        patch_type=PatchType.MERGE,
+    )
+
+
+def test_kube_interface_patch_labels(mocker, tmp_kubeconf):
+    mock_subprocess = mocker.patch("subprocess.check_output")
+    mock_subprocess.return_value = b"{}"
+    resource_name = str(uuid.uuid4())
+    namespace = str(uuid.uuid4())
+    context = "context1"
+
+    k = KubeInterface(tmp_kubeconf, defaults=defaults, context_name=context)
+    k.patch_labels(
+        "serviceaccount",
+        resource_name,
+        add={"key1": "value1"},
+        remove=["key2"],
+        namespace=namespace,
+    )
+
+    mock_subprocess.assert_called_once_with(
+        f"kubectl --kubeconfig {tmp_kubeconf} --namespace {namespace} --context {context} "
+        f"label serviceaccount {resource_name} --overwrite key1=value1 key2- -o json".split(),
+        shell=False,
+        stderr=subprocess.STDOUT,
+    )
+
+
+def test_lightkube_create_property_file_entries(tmp_kubeconf, tmp_path):
+    property_file = tmp_path / "spark.conf"
+    property_file.write_text("spark.app.name=my-app\nspark.executor.instances=2\n")
+
+    k = LightKube(kube_config_file=tmp_kubeconf, defaults=defaults)
+
+    assert k.create_property_file_entries(str(property_file)) == {
+        "spark.app.name": base64.b64encode(b"my-app").decode("ascii"),
+        "spark.executor.instances": base64.b64encode(b"2").decode("ascii"),
+    }
+
+
 def test_lightkube_create_secret(mocker, tmp_kubeconf):
     mock_lightkube_codecs_load_all_yaml = mocker.patch("lightkube.codecs.load_all_yaml")
     mock_open = mocker.patch("builtins.open")
@@ -762,8 +1236,7 @@ def test_lightkube_create_secret(mocker, tmp_kubeconf):
             "apiVersion": "v1",
             "kind": "Secret",
             "metadata": {"name": resource_name, "namespace": namespace},
-            # "stringData": { label_key : base64.b64encode(label_value.encode("ascii")) },
-            "stringData": {},
+            "data": {},
         }
     )
 
@@ -855,12 +1328,81 @@ def test_lightkube_delete_role_binding(mocker, tmp_kubeconf):
     )
 
 
+def test_kube_interface_create_secret(mocker, tmp_kubeconf):
+    mock_subprocess = mocker.patch("subprocess.check_output")
+    mock_subprocess.return_value = b"secret/my-secret\n"
+    namespace = str(uuid.uuid4())
+    context = "context1"
+    data = {"spark.key": base64.b64encode(b"value").decode("ascii")}
+    labels = {MANAGED_BY_LABELNAME: SPARK8S_LABEL}
+
+    k = KubeInterface(tmp_kubeconf, defaults=defaults, context_name=context)
+    k.create_secret("my-secret", data, namespace=namespace, labels=labels)
+
+    prefix = f"kubectl --kubeconfig {tmp_kubeconf} --namespace {namespace} --context {context}"
+    mock_subprocess.assert_called_once_with(
+        f"{prefix} create -f - -o name".split(),
+        shell=False,
+        stderr=subprocess.STDOUT,
+        input=mocker.ANY,
+    )
+    assert json.loads(mock_subprocess.call_args.kwargs["input"]) == {
+        "apiVersion": "v1",
+        "kind": "Secret",
+        "metadata": {"name": "my-secret", "labels": labels},
+        "data": data,
+    }
+
+
+def test_kube_interface_apply_manifest(mocker, tmp_kubeconf):
+    mock_subprocess = mocker.patch("subprocess.check_output")
+    mock_subprocess.return_value = b"serviceaccount/sa\nrole/sa-role\n"
+    namespace = str(uuid.uuid4())
+    context = "context1"
+
+    k = KubeInterface(tmp_kubeconf, defaults=defaults, context_name=context)
+    manifests = K8sServiceAccountRegistry(k)._account_manifests("sa", namespace)
+    k.apply_manifest(manifests)
+
+    mock_subprocess.assert_called_once_with(
+        f"kubectl --kubeconfig {tmp_kubeconf} --context {context} apply -f - -o name".split(),
+        shell=False,
+        stderr=subprocess.STDOUT,
+        input=mocker.ANY,
+    )
+    applied = list(yaml.safe_load_all(mock_subprocess.call_args.kwargs["input"]))
+    assert applied == manifests
+
+
+def test_lightkube_apply_manifest(mocker, tmp_kubeconf):
+    mock_lightkube_client_apply = mocker.patch("lightkube.Client.apply")
+    namespace = str(uuid.uuid4())
+
+    k = LightKube(kube_config_file=tmp_kubeconf, defaults=defaults)
+    k.apply_manifest(K8sServiceAccountRegistry(k)._account_manifests("sa", namespace))
+
+    applied = [call.args[0] for call in mock_lightkube_client_apply.call_args_list]
+    assert [type(obj) for obj in applied] == [
+        LightKubeServiceAccount,
+        Role,
+        RoleBinding,
+    ]
+    assert [obj.metadata.name for obj in applied] == [
+        "sa",
+        "sa-role",
+        "sa-role-binding",
+    ]
+    for obj in applied:
+        assert obj.metadata.namespace == namespace
+        assert obj.metadata.labels == {MANAGED_BY_LABELNAME: SPARK8S_LABEL}
+
+
 def test_kube_interface_create(mocker, tmp_path):
     mock_subprocess = mocker.patch("subprocess.check_output")
 
     # mock logic
     def side_effect(*args, **kwargs):
-        return values[args[0]]
+        return values[" ".join(args[0])]
 
     mock_subprocess.side_effect = side_effect
 
@@ -918,7 +1460,9 @@ def test_kube_interface_create(mocker, tmp_path):
         **{"k1": "v1", "k2": ["v21", "v22"]},
     )
 
-    mock_subprocess.assert_any_call(cmd_create, shell=True, stderr=subprocess.STDOUT)
+    mock_subprocess.assert_any_call(
+        cmd_create.split(), shell=False, stderr=subprocess.STDOUT
+    )
 
 
 def test_kube_interface_delete(mocker, tmp_path):
@@ -926,7 +1470,7 @@ def test_kube_interface_delete(mocker, tmp_path):
 
     # mock logic
     def side_effect(*args, **kwargs):
-        return values[args[0]]
+        return values[" ".join(args[0])]
 
     mock_subprocess.side_effect = side_effect
 
@@ -979,7 +1523,9 @@ def test_kube_interface_delete(mocker, tmp_path):
     k = KubeInterface(kube_config_file=kube_config_file, defaults=defaults)
     k.delete(resource_type, resource_name, namespace)
 
-    mock_subprocess.assert_any_call(cmd_delete, shell=True, stderr=subprocess.STDOUT)
+    mock_subprocess.assert_any_call(
+        cmd_delete.split(), shell=False, stderr=subprocess.STDOUT
+    )
 
 
 def test_kube_interface_delete_no_kubeconfig(mocker):
@@ -1000,7 +1546,9 @@ def test_kube_interface_delete_no_kubeconfig(mocker):
     k = KubeInterface(kube_config_file=None, defaults=defaults)
     k.delete(resource_type, resource_name, namespace)
 
-    mock_subprocess.assert_any_call(cmd_delete, shell=True, stderr=subprocess.STDOUT)
+    mock_subprocess.assert_any_call(
+        cmd_delete.split(), shell=False, stderr=subprocess.STDOUT
+    )
 
 
 def test_lightkube_get_service_accounts(mocker, tmp_kubeconf):
@@ -1031,6 +1579,68 @@ def test_lightkube_get_service_accounts(mocker, tmp_kubeconf):
     k.get_service_accounts(labels=[label])
 
 
+def test_lightkube_get_service_accounts_label_mapping(mocker, tmp_kubeconf):
+    mock_lightkube_client_list = mocker.patch("lightkube.Client.list")
+    namespace = str(uuid.uuid4())
+    labels = {MANAGED_BY_LABELNAME: SPARK8S_LABEL, PRIMARY_LABELNAME: None}
+
+    mock_lightkube_client_list.return_value = []
+
+    k = LightKube(kube_config_file=tmp_kubeconf, defaults=defaults)
+    assert k.get_service_accounts(namespace=namespace, labels=labels) == []
+
+    mock_lightkube_client_list.assert_called_once_with(
+        res=LightKubeServiceAccount, namespace=namespace, labels=labels
+    )
+
+
+def test_lightkube_get_secrets(mocker, tmp_kubeconf):
+    mock_lightkube_client_list = mocker.patch("lightkube.Client.list")
+    namespace = str(uuid.uuid4())
+    labels = {MANAGED_BY_LABELNAME: SPARK8S_LABEL}
+
+    mock_lightkube_client_list.return_value = [
+        Secret.from_dict(
+            {
+                "apiVersion": "v1",
+                "kind": "Secret",
+                "metadata": {"name": "secret", "namespace": namespace},
+                "data": {"key": base64.b64encode(b"value").decode("ascii")},
+            }
+        )
+    ]
+
+    k = LightKube(kube_config_file=tmp_kubeconf, defaults=defaults)
+    secrets = k.get_secrets(namespace=namespace, labels=labels)
+
+    assert secrets[0]["data"] == {"key": "value"}
+    mock_lightkube_client_list.assert_called_once_with(
+        res=Secret, namespace=namespace, labels=labels
+    )
+
+
+def test_lightkube_get_secrets_all_namespaces(mocker, tmp_kubeconf):
+    mock_lightkube_client_list = mocker.patch("lightkube.Client.list")
+    labels = {MANAGED_BY_LABELNAME: SPARK8S_LABEL}
+
+    forbidden = ApiError(
+        response=httpx.Response(
+            403,
+            json={"kind": "Status", "code": 403, "message": "forbidden"},
+            request=httpx.Request("GET", "https://0.0.0.0"),
+        )
+    )
+    mock_lightkube_client_list.side_effect = [forbidden, []]
+
+    k = LightKube(kube_config_file=tmp_kubeconf, defaults=defaults)
+
+    assert k.get_secrets(labels=labels) == []
+    assert mock_lightkube_client_list.call_args_list == [
+        mocker.call(res=Secret, namespace="*", labels=labels),
+        mocker.call(res=Secret, namespace=k.namespace, labels=labels),
+    ]
+
+
 def test_lightkube_get_service_account(mocker, tmp_kubeconf):
     mock_lightkube_codecs_dump_all_yaml = mocker.patch("lightkube.codecs.dump_all_yaml")
     mock_lightkube_client_get = mocker.patch("lightkube.Client.get")
@@ -1057,7 +1667,7 @@ def test_lightkube_get_service_account(mocker, tmp_kubeconf):
 
 
 def test_kube_interface_get_service_accounts(mocker, tmp_path):
-    mock_subprocess = mocker.patch("subprocess.check_output")
+    mock_subprocess = mocker.patch("subprocess.Popen")
 
     test_id = str(uuid.uuid4())
     kubeconfig = str(uuid.uuid4())
@@ -1097,7 +1707,7 @@ def test_kube_interface_get_service_accounts(mocker, tmp_path):
     with open(kube_config_file, "w") as fid:
         yaml.dump(kubeconfig_yaml, fid, sort_keys=False)
 
-    cmd_get_sa = f"kubectl --kubeconfig {kube_config_file} --namespace {namespace} --context {context} get serviceaccount -l {label1}  -l {label2} -o yaml"
+    cmd_get_sa = f"kubectl --kubeconfig {kube_config_file} --namespace {namespace} --context {context} get serviceaccount -l {label1},{label2} --chunk-size=0 -o json"
     output_get_sa_yaml = {
         "apiVersion": "v1",
         "items": [
@@ -1120,20 +1730,19 @@ def test_kube_interface_get_service_accounts(mocker, tmp_path):
         "kind": "List",
         "metadata": {"resourceVersion": ""},
     }
-    output_get_sa = yaml.dump(output_get_sa_yaml, sort_keys=False).encode("utf-8")
+    output_get_sa = json.dumps(output_get_sa_yaml).encode("utf-8")
 
-    # mock logic
-    def side_effect(*args, **kwargs):
-        return output_get_sa
-
-    mock_subprocess.side_effect = side_effect
+    mock_subprocess.return_value.stdout = io.BytesIO(output_get_sa)
+    mock_subprocess.return_value.wait.return_value = 0
 
     k = KubeInterface(kube_config_file=kube_config_file, defaults=defaults)
     sa_list = k.get_service_accounts(namespace, labels)
     assert sa_list[0].get("metadata").get("name") == username
     assert sa_list[0].get("metadata").get("namespace") == namespace
 
-    mock_subprocess.assert_any_call(cmd_get_sa, shell=True, stderr=subprocess.STDOUT)
+    mock_subprocess.assert_any_call(
+        cmd_get_sa.split(), shell=False, stdout=subprocess.PIPE, stderr=mocker.ANY
+    )
 
 
 def test_kube_interface_autodetect(mocker, tmp_path):
@@ -1176,7 +1785,7 @@ def test_kube_interface_autodetect(mocker, tmp_path):
         yaml.dump(kubeconfig_yaml, fid, sort_keys=False)
 
     cmd_autodetect = (
-        f"kubectl --context {context} config view --raw " "--minify -o yaml"
+        f"kubectl --context {context} config view --raw " "--minify -o json"
     )
     output_autodetect_yaml = {
         "apiVersion": "v1",
@@ -1200,9 +1809,7 @@ def test_kube_interface_autodetect(mocker, tmp_path):
         "kind": "List",
         "metadata": {"resourceVersion": ""},
     }
-    output_autodetect = yaml.dump(output_autodetect_yaml, sort_keys=False).encode(
-        "utf-8"
-    )
+    output_autodetect = json.dumps(output_autodetect_yaml).encode("utf-8")
 
     # mock logic
     def side_effect(*args, **kwargs):
@@ -1215,9 +1822,13 @@ def test_kube_interface_autodetect(mocker, tmp_path):
     assert ki.kubectl_cmd == "kubectl"
 
     mock_subprocess.assert_any_call(
-        cmd_autodetect, shell=True, stderr=subprocess.STDOUT
+        cmd_autodetect.split(), shell=False, stderr=subprocess.STDOUT
     )
 
+    # the exported configuration is reused until the kube config files change
+    KubeInterface.autodetect(context, defaults)
+    assert mock_subprocess.call_count == 1
+
 
 def test_k8s_registry_retrieve_account_configurations(mocker):
     mock_kube_interface = mocker.patch("spark8t.services.KubeInterface")
@@ -1232,6 +1843,20 @@ def test_k8s_registry_retrieve_account_configurations(mocker):
     )
 
 
+def test_k8s_registry_retrieve_missing_account_configurations(mocker):
+    mock_kube_interface = mocker.patch("spark8t.services.KubeInterface")
+    mock_kube_interface.get_secret.return_value = None
+    registry = K8sServiceAccountRegistry(mock_kube_interface)
+    assert (
+        len(
+            registry._retrieve_account_configurations(
+                str(uuid.uuid4()), str(uuid.uuid4())
+            )
+        )
+        == 0
+    )
+
+
 def test_k8s_registry_all(mocker):
     mock_kube_interface = mocker.patch("spark8t.services.KubeInterface")
     data = {"k": "v"}
@@ -1272,6 +1897,75 @@ def test_k8s_registry_all(mocker):
     assert output[1].primary is False
 
 
+def test_k8s_registry_all_batched_configurations(mocker):
+    mock_kube_interface = mocker.patch("spark8t.services.KubeInterface")
+
+    name1 = str(uuid.uuid4())
+    name2 = str(uuid.uuid4())
+    namespace = str(uuid.uuid4())
+
+    mock_kube_interface.get_service_accounts.return_value = [
+        {"metadata": {"name": name, "namespace": namespace, "labels": {}}}
+        for name in (name1, name2)
+    ]
+    mock_kube_interface.get_secrets.return_value = [
+        {
+            "metadata": {
+                "name": f"{SPARK8S_LABEL}-sa-conf-{name1}",
+                "namespace": namespace,
+            },
+            "data": {"spark.key": "value1"},
+        }
+    ]
+    mock_kube_interface.get_secret.return_value = {"data": {"spark.key": "value2"}}
+    api_server = PropertyMock(return_value="https://0.0.0.0")
+    type(mock_kube_interface).api_server = api_server
+
+    registry = K8sServiceAccountRegistry(mock_kube_interface)
+    output = registry.all(namespace)
+
+    assert [account.api_server for account in output] == ["https://0.0.0.0"] * 2
+    api_server.assert_called_once_with()
+    assert output[0].extra_confs.props == {"spark.key": "value1"}
+    assert output[1].extra_confs.props == {"spark.key": "value2"}
+    mock_kube_interface.get_secrets.assert_called_once_with(
+        namespace=namespace, labels={MANAGED_BY_LABELNAME: SPARK8S_LABEL}
+    )
+    mock_kube_interface.get_secret.assert_called_once_with(
+        f"{SPARK8S_LABEL}-sa-conf-{name2}", namespace=namespace
+    )
+
+
+def test_k8s_registry_get_primary(mocker):
+    mock_kube_interface = mocker.patch("spark8t.services.KubeInterface")
+    mock_kube_interface.get_secret.return_value = {"data": {}}
+
+    name = str(uuid.uuid4())
+    namespace = str(uuid.uuid4())
+
+    mock_kube_interface.get_service_accounts.return_value = [
+        {
+            "metadata": {
+                "name": name,
+                "namespace": namespace,
+                "labels": {PRIMARY_LABELNAME: "True"},
+            }
+        }
+    ]
+
+    registry = K8sServiceAccountRegistry(mock_kube_interface)
+    primary = registry.get_primary(namespace)
+
+    assert primary.id == f"{namespace}:{name}"
+    mock_kube_interface.get_secret.assert_not_called()
+    assert len(primary.extra_confs) == 0
+    mock_kube_interface.get_secret.assert_called_once()
+    mock_kube_interface.get_service_accounts.assert_called_once_with(
+        namespace=namespace,
+        labels={MANAGED_BY_LABELNAME: SPARK8S_LABEL, PRIMARY_LABELNAME: None},
+    )
+
+
 def test_k8s_registry_set_primary(mocker):
     mock_kube_interface = mocker.patch("spark8t.services.KubeInterface")
     data = {"k": "v"}
@@ -1308,35 +2002,61 @@ def test_k8s_registry_set_primary(mocker):
     registry = K8sServiceAccountRegistry(mock_kube_interface)
     assert registry.set_primary(f"{namespace2}:{name2}") == f"{namespace2}:{name2}"
 
-    mock_kube_interface.remove_label.assert_any_call(
+    mock_kube_interface.patch_labels.assert_any_call(
         "serviceaccount",
         name1,
-        f"{PRIMARY_LABELNAME}",
-        namespace1,
+        add=None,
+        remove=[PRIMARY_LABELNAME],
+        namespace=namespace1,
     )
 
-    mock_kube_interface.remove_label.assert_any_call(
+    mock_kube_interface.patch_labels.assert_any_call(
         "rolebinding",
         f"{name1}-role-binding",
-        f"{PRIMARY_LABELNAME}",
-        namespace1,
+        add=None,
+        remove=[PRIMARY_LABELNAME],
+        namespace=namespace1,
     )
 
-    mock_kube_interface.set_label.assert_any_call(
+    mock_kube_interface.patch_labels.assert_any_call(
         "serviceaccount",
         name2,
-        f"{PRIMARY_LABELNAME}=True",
-        namespace2,
+        add={PRIMARY_LABELNAME: "True"},
+        remove=None,
+        namespace=namespace2,
     )
 
-    mock_kube_interface.set_label.assert_any_call(
+    mock_kube_interface.patch_labels.assert_any_call(
         "rolebinding",
         f"{name2}-role-binding",
-        f"{PRIMARY_LABELNAME}=True",
-        namespace2,
+        add={PRIMARY_LABELNAME: "True"},
+        remove=None,
+        namespace=namespace2,
     )
 
 
+def test_k8s_registry_set_primary_already_primary(mocker):
+    mock_kube_interface = mocker.patch("spark8t.services.KubeInterface")
+
+    name = str(uuid.uuid4())
+    namespace = str(uuid.uuid4())
+
+    sa = {
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+            "labels": {PRIMARY_LABELNAME: "True"},
+        }
+    }
+
+    mock_kube_interface.get_service_accounts.return_value = [sa]
+    mock_kube_interface.get_service_account.return_value = sa
+    registry = K8sServiceAccountRegistry(mock_kube_interface)
+    assert registry.set_primary(f"{namespace}:{name}") == f"{namespace}:{name}"
+
+    mock_kube_interface.patch_labels.assert_not_called()
+
+
 def test_k8s_registry_create(mocker):
     mock_kube_interface = mocker.patch("spark8t.services.KubeInterface")
     data = {"k": "v"}
@@ -1387,91 +2107,107 @@ def test_k8s_registry_create(mocker):
 
     mock_kube_interface.get_service_accounts.return_value = [sa1, sa2, sa3]
     mock_kube_interface.get_service_account.return_value = sa3
-    mock_kube_interface.set_label.return_value = 0
     mock_kube_interface.remove_label.return_value = 0
-    mock_kube_interface.create.return_value = 0
     mock_kube_interface.exists.return_value = False
+    mock_kube_interface.defaults = defaults
 
     registry = K8sServiceAccountRegistry(mock_kube_interface)
     assert registry.create(sa3_obj) == sa3_obj.id
 
-    for call in mock_kube_interface.create.call_args_list:
-        print(call)
+    mock_kube_interface.apply_manifest.assert_called_once()
+    (manifests,) = mock_kube_interface.apply_manifest.call_args.args
 
-    mock_kube_interface.create.assert_any_call(
-        KubernetesResourceType.SERVICEACCOUNT,
-        name3,
-        namespace=namespace3,
-        username=name3,
-    )
+    assert [
+        (manifest["kind"], manifest["metadata"]["name"]) for manifest in manifests
+    ] == [
+        ("ServiceAccount", name3),
+        ("Role", f"{name3}-role"),
+        ("RoleBinding", f"{name3}-role-binding"),
+    ]
+    for manifest in manifests:
+        assert manifest["metadata"]["namespace"] == namespace3
+        assert manifest["metadata"]["labels"] == {MANAGED_BY_LABELNAME: SPARK8S_LABEL}
 
-    mock_kube_interface.create.assert_any_call(
-        "role",
-        f"{name3}-role",
-        namespace=namespace3,
-        **{
-            "resource": [
+    assert manifests[1]["rules"] == [
+        {
+            "apiGroups": [""],
+            "resources": [
                 "pods",
                 "configmaps",
                 "services",
                 "serviceaccounts",
                 "secrets",
             ],
-            "verb": ["create", "get", "list", "watch", "delete"],
-        },
+            "verbs": ["create", "get", "list", "watch", "delete"],
+        }
+    ]
+    assert manifests[2]["roleRef"]["name"] == f"{name3}-role"
+    assert manifests[2]["subjects"] == [
+        {"kind": "ServiceAccount", "name": name3, "namespace": namespace3}
+    ]
+
+    mock_kube_interface.set_label.assert_not_called()
+    mock_kube_interface.create.assert_not_called()
+
+    mock_kube_interface.patch_labels.assert_any_call(
+        KubernetesResourceType.SERVICEACCOUNT,
+        name1,
+        add=None,
+        remove=[PRIMARY_LABELNAME],
+        namespace=namespace1,
     )
 
-    mock_kube_interface.create.assert_any_call(
+    mock_kube_interface.patch_labels.assert_any_call(
         KubernetesResourceType.ROLEBINDING,
-        f"{name3}-role-binding",
-        namespace=namespace3,
-        **{
-            "role": f"{name3}-role",
-            "serviceaccount": sa3_obj.id,
-            "username": name3,
-        },
+        f"{name1}-role-binding",
+        add=None,
+        remove=[PRIMARY_LABELNAME],
+        namespace=namespace1,
     )
 
-    mock_kube_interface.set_label.assert_any_call(
+    mock_kube_interface.patch_labels.assert_any_call(
         KubernetesResourceType.SERVICEACCOUNT,
         name3,
-        f"{MANAGED_BY_LABELNAME}={SPARK8S_LABEL}",
+        add={PRIMARY_LABELNAME: "True"},
+        remove=None,
         namespace=namespace3,
     )
 
-    mock_kube_interface.set_label.assert_any_call(
+    mock_kube_interface.patch_labels.assert_any_call(
         KubernetesResourceType.ROLEBINDING,
         f"{name3}-role-binding",
-        f"{MANAGED_BY_LABELNAME}={SPARK8S_LABEL}",
+        add={PRIMARY_LABELNAME: "True"},
+        remove=None,
         namespace=namespace3,
     )
 
-    mock_kube_interface.remove_label.assert_any_call(
-        KubernetesResourceType.SERVICEACCOUNT,
-        name1,
-        f"{PRIMARY_LABELNAME}",
-        namespace1,
-    )
 
-    mock_kube_interface.remove_label.assert_any_call(
-        KubernetesResourceType.ROLEBINDING,
-        f"{name1}-role-binding",
-        f"{PRIMARY_LABELNAME}",
-        namespace1,
-    )
+def test_k8s_registry_set_configurations(mocker):
+    mock_kube_interface = mocker.patch("spark8t.services.KubeInterface")
 
-    mock_kube_interface.set_label.assert_any_call(
-        KubernetesResourceType.SERVICEACCOUNT,
-        name3,
-        f"{PRIMARY_LABELNAME}=True",
-        namespace3,
+    name = str(uuid.uuid4())
+    namespace = str(uuid.uuid4())
+
+    registry = K8sServiceAccountRegistry(mock_kube_interface)
+    configurations = PropertyFile({"spark.key": " value ", "spark_key": "other"})
+
+    assert (
+        registry.set_configurations(f"{namespace}:{name}", configurations)
+        == f"{namespace}:{name}"
     )
 
-    mock_kube_interface.set_label.assert_any_call(
-        KubernetesResourceType.ROLEBINDING,
-        f"{name3}-role-binding",
-        f"{PRIMARY_LABELNAME}=True",
-        namespace3,
+    mock_kube_interface.delete_many.assert_called_once_with(
+        [(KubernetesResourceType.SECRET, f"{SPARK8S_LABEL}-sa-conf-{name}")],
+        namespace=namespace,
+    )
+    mock_kube_interface.create_secret.assert_called_once_with(
+        f"{SPARK8S_LABEL}-sa-conf-{name}",
+        {
+            "spark.key": base64.b64encode(b"value").decode("ascii"),
+            "spark__key": base64.b64encode(b"other").decode("ascii"),
+        },
+        namespace=namespace,
+        labels={MANAGED_BY_LABELNAME: SPARK8S_LABEL},
     )
 
 
@@ -1483,25 +2219,119 @@ def test_k8s_registry_delete(mocker):
     name2 = str(uuid.uuid4())
     namespace2 = str(uuid.uuid4())
 
-    mock_kube_interface.delete.return_value = 0
-
     registry = K8sServiceAccountRegistry(mock_kube_interface)
 
     assert registry.delete(f"{namespace2}:{name2}") == f"{namespace2}:{name2}"
-    mock_kube_interface.delete.assert_any_call(
-        KubernetesResourceType.SERVICEACCOUNT, name2, namespace=namespace2
+    mock_kube_interface.delete_many.assert_called_once_with(
+        [
+            (KubernetesResourceType.SERVICEACCOUNT, name2),
+            (KubernetesResourceType.ROLE, f"{name2}-role"),
+            (KubernetesResourceType.ROLEBINDING, f"{name2}-role-binding"),
+            (KubernetesResourceType.SECRET, f"{SPARK8S_LABEL}-sa-conf-{name2}"),
+        ],
+        namespace=namespace2,
     )
-    mock_kube_interface.delete.assert_any_call(
-        KubernetesResourceType.ROLE, f"{name2}-role", namespace=namespace2
+
+
+def test_k8s_registry_delete_partial_failure(mocker):
+    mock_kube_interface = mocker.patch("spark8t.services.KubeInterface")
+
+    name = str(uuid.uuid4())
+    namespace = str(uuid.uuid4())
+
+    mock_kube_interface.delete_many.side_effect = K8sResourceNotFound(
+        f"{name}-role", KubernetesResourceType.ROLE
     )
-    mock_kube_interface.delete.assert_any_call(
-        KubernetesResourceType.ROLEBINDING,
-        f"{name2}-role-binding",
-        namespace=namespace2,
+
+    registry = K8sServiceAccountRegistry(mock_kube_interface)
+
+    assert registry.delete(f"{namespace}:{name}") == f"{namespace}:{name}"
+    assert mock_kube_interface.delete_many.call_count == 1
+
+
+def test_kube_interface_delete_many(mocker, tmp_kubeconf):
+    mock_subprocess = mocker.patch("subprocess.check_output")
+    mock_subprocess.return_value = b"serviceaccount/sa\nrole/sa-role\n"
+    namespace = str(uuid.uuid4())
+    context = "context1"
+
+    k = KubeInterface(tmp_kubeconf, defaults=defaults, context_name=context)
+    k.delete_many(
+        [
+            (KubernetesResourceType.SERVICEACCOUNT, "sa"),
+            (KubernetesResourceType.ROLE, "sa-role"),
+        ],
+        namespace=namespace,
     )
 
-    mock_kube_interface.delete.assert_any_call(
-        KubernetesResourceType.SECRET,
-        f"{SPARK8S_LABEL}-sa-conf-{name2}",
-        namespace=namespace2,
+    prefix = f"kubectl --kubeconfig {tmp_kubeconf} --namespace {namespace} --context {context}"
+    mock_subprocess.assert_called_once_with(
+        f"{prefix} delete serviceaccount/sa role/sa-role --ignore-not-found -o name".split(),
+        shell=False,
+        stderr=subprocess.STDOUT,
+    )
+
+
+def test_kube_interface_delete_many_normalizes_secret_generic(mocker, tmp_kubeconf):
+    mock_subprocess = mocker.patch("subprocess.check_output")
+    mock_subprocess.return_value = b"secret/sa-secret\n"
+    namespace = str(uuid.uuid4())
+    context = "context1"
+
+    k = KubeInterface(tmp_kubeconf, defaults=defaults, context_name=context)
+    k.delete_many(
+        [(KubernetesResourceType.SECRET_GENERIC, "sa-secret")], namespace=namespace
+    )
+
+    prefix = f"kubectl --kubeconfig {tmp_kubeconf} --namespace {namespace} --context {context}"
+    mock_subprocess.assert_called_once_with(
+        f"{prefix} delete secret/sa-secret --ignore-not-found -o name".split(),
+        shell=False,
+        stderr=subprocess.STDOUT,
+    )
+
+
+def test_kube_interface_delete_many_rejects_namespace(mocker, tmp_kubeconf):
+    mock_subprocess = mocker.patch("subprocess.check_output")
+
+    k = KubeInterface(tmp_kubeconf, defaults=defaults, context_name="context1")
+    with pytest.raises(ValueError):
+        k.delete_many(
+            [
+                (KubernetesResourceType.SERVICEACCOUNT, "sa"),
+                (KubernetesResourceType.NAMESPACE, "ns"),
+            ]
+        )
+
+    mock_subprocess.assert_not_called()
+
+
+def test_lightkube_delete_many_ignores_not_found(mocker, tmp_kubeconf):
+    mock_lightkube_client_delete = mocker.patch("lightkube.Client.delete")
+    namespace = str(uuid.uuid4())
+
+    not_found = ApiError(
+        response=httpx.Response(
+            404,
+            json={"kind": "Status", "code": 404, "message": "not found"},
+            request=httpx.Request("DELETE", "https://0.0.0.0"),
+        )
     )
+
+    def side_effect(res, name, namespace=None):
+        if res is Role:
+            raise not_found
+
+    mock_lightkube_client_delete.side_effect = side_effect
+
+    k = LightKube(kube_config_file=tmp_kubeconf, defaults=defaults)
+    k.delete_many(
+        [
+            (KubernetesResourceType.SERVICEACCOUNT, "sa"),
+            (KubernetesResourceType.ROLE, "sa-role"),
+            (KubernetesResourceType.ROLEBINDING, "sa-role-binding"),
+        ],
+        namespace=namespace,
+    )
+
+    assert mock_lightkube_client_delete.call_count == 3
@@ -1,8 +1,20 @@
+import io
+import json
 import re
+import subprocess
+import sys
+import threading
 
 import pytest
 
-from spark8t.utils import PercentEncodingSerializer
+from spark8t.utils import (
+    EXECUTOR_THREAD_NAME_PREFIX,
+    PercentEncodingSerializer,
+    execute_command_stream,
+    get_executor,
+    iter_json_items,
+    stream_json_shell_items,
+)
 
 requirement = re.compile(r"[-._a-zA-Z0-9]+")
 
@@ -34,3 +46,80 @@ def test_serializer(serializer, input_string):
     serialized = serializer.serialize(input_string)
     assert check_compliance(serialized)
     assert serializer.deserialize(serialized) == input_string
+
+
+@pytest.mark.parametrize(
+    "input_string",
+    ["spark.executor.memory", "spark.kubernetes/path", "spark-property~1"],
+)
+def test_serializer_plain_strings_are_unchanged(serializer, input_string):
+    assert serializer.serialize(input_string) == input_string
+    assert serializer.deserialize(input_string) == input_string
+
+
+def test_serializer_keys(serializer):
+    mapping = {"spark_property": "1", "spark.property": "2", "spark property": "3"}
+
+    serialized = serializer.serialize_keys(mapping)
+
+    assert serialized == {serializer.serialize(k): v for k, v in mapping.items()}
+    assert serializer.deserialize_keys(serialized) == mapping
+
+
+def test_get_executor_is_shared():
+    executor = get_executor()
+
+    assert get_executor() is executor
+    assert (
+        executor.submit(lambda: threading.current_thread().name)
+        .result()
+        .startswith(EXECUTOR_THREAD_NAME_PREFIX)
+    )
+
+
+ITEMS = [
+    {"metadata": {"name": f"sa-{i}", "labels": {"app": "spark"}}, "data": [i, "]"]}
+    for i in range(5)
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 2**16])
+def test_iter_json_items(chunk_size):
+    payload = json.dumps({"apiVersion": "v1", "items": ITEMS, "kind": "List"}, indent=2)
+    stream = io.BytesIO(payload.encode("utf-8"))
+
+    assert list(iter_json_items(stream, chunk_size=chunk_size)) == ITEMS
+
+
+@pytest.mark.parametrize("payload", [b'{"items": []}', b'{"items" : [ ]}', b""])
+def test_iter_json_items_empty(payload):
+    assert list(iter_json_items(io.BytesIO(payload), chunk_size=4)) == []
+
+
+def test_iter_json_items_truncated():
+    payload = json.dumps({"items": ITEMS}).encode("utf-8")[:-20]
+
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_items(io.BytesIO(payload), chunk_size=8))
+
+
+def test_stream_json_shell_items():
+    payload = json.dumps({"items": ITEMS})
+    cmd = [sys.executable, "-c", f"print({payload!r})"]
+
+    assert list(stream_json_shell_items(cmd)) == ITEMS
+
+
+def test_execute_command_stream_failure():
+    cmd = [
+        sys.executable,
+        "-c",
+        "import sys; print('partial'); sys.stderr.write('boom'); sys.exit(3)",
+    ]
+
+    with pytest.raises(subprocess.CalledProcessError) as exc_info:
+        with execute_command_stream(cmd) as stdout:
+            assert stdout.read() == b"partial\n"
+
+    assert exc_info.value.returncode == 3
+    assert exc_info.value.output == b"boom"